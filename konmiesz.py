@@ -3,7 +3,7 @@
 #       fswatch *py |\
 #       xargs -n 1 -I {} autopep8 --in-place --aggressive --aggressiv {}
 
-from typing import Callable, NamedTuple, Tuple
+from typing import Callable, Iterable, Iterator, NamedTuple, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -47,6 +47,8 @@ KOL_PREMIA_TOTAL = (GR_KOL_PREMIA, PREMIA_TOTAL)
 KOL_PREMIA_BEZ_PROWIZJI = (GR_KOL_PREMIA, PREMIA_BEZ_PROWIZJI)
 KOL_TOTAL_Z_PREMIA = (GR_KOL_TOTALS, TOTAL_Z_PREMIA)
 KOL_TOTAL_TOTAL = (GR_KOL_TOTALS, TOTAL_Z_ODSETKAMI_I_PREMIA_BEZ_PROWIZJI)
+SILNIK_REFERENCYJNY = 'referencyjny'
+SILNIK_SZYBKI = 'szybki'
 
 
 class Procent:
@@ -81,6 +83,11 @@ class ProcentInflacji(Procent):
 class Bank(NamedTuple):
     name: str
     oprocentowanie_lokaty: Callable[[pd.DatetimeIndex], DataFrame]
+    # oprocentowanie pojedynczej wpłaty: (data pierwszej wpłaty, numer wpłaty,
+    # data wpłaty) -> Procent, pozwala liczyć symulację bez znajomości dat
+    # wszystkich wpłat
+    oprocentowanie_wplaty: Callable[[pd.Timestamp, int, pd.Timestamp],
+                                    Procent] | None = None
 
 
 def roczny_wskaznik_premii(inflacja: float, wzrost_m2: float | None) -> float:
@@ -151,6 +158,33 @@ def multicols(grupa_kolumn: str, kolumny: list[str]) -> list[Tuple[str, str]]:
     return [(grupa_kolumn, kolumna) for kolumna in kolumny]
 
 
+KOLUMNY_KONTA = \
+    multicols(GR_KOL_WPLATY,
+              [MIESIAC,
+               ROK,
+               WPLATA,
+               WPLATA_TOTAL]) + \
+    multicols(GR_KOL_ODSETKI,
+              [ODSETKI_BANKU_PCT,
+               ODSETKI_BANKU_ABS,
+               ODSETKI_BANKU_TOTAL]) + \
+    multicols(GR_KOL_PREMIA,
+              [PREMIA_SKLADNIK_NALICZ,
+               PREMIA_TOTAL,
+               PREMIA_BEZ_PROWIZJI]) + \
+    multicols(GR_KOL_TOTALS,
+              [TOTAL_Z_PREMIA,
+               TOTAL_Z_ODSETKAMI_I_PREMIA_BEZ_PROWIZJI])
+
+KOLUMNY_ROCZNE = \
+    multicols(GR_KOL_WPLATY, [WPLATA_TOTAL]) + \
+    multicols(GR_KOL_ODSETKI, [ODSETKI_BANKU_TOTAL]) + \
+    multicols(GR_KOL_PREMIA, [PREMIA_TOTAL, PREMIA_BEZ_PROWIZJI]) + \
+    multicols(GR_KOL_TOTALS, [
+        TOTAL_Z_ODSETKAMI_I_PREMIA_BEZ_PROWIZJI
+    ])
+
+
 def oblicz_premie_mieszkaniowa(df: DataFrame,
                                zalozenia: DataFrame) -> DataFrame:
     """
@@ -209,15 +243,24 @@ def symulacja_konta(data_startu: str,
                     ile_wplat: int,
                     wysokosc_wplat: int,
                     zalozenia: DataFrame,
-                    lokata: Bank) -> (Styler,
-                                      Styler,
-                                      DataFrame,
-                                      DataFrame):
-    daty_wplat = pd.date_range(
-        start=data_startu,
-        periods=ile_wplat,
-        freq=pd.offsets.MonthBegin()
-    )
+                    lokata: Bank,
+                    silnik: str = SILNIK_REFERENCYJNY) -> (Styler,
+                                                           Styler,
+                                                           DataFrame,
+                                                           DataFrame):
+    if silnik == SILNIK_SZYBKI:
+        # tablice numpy zamiast pandas.apply, wyniki w tym samym formacie
+        sesja = SesjaSymulacji(
+            data_startu=data_startu, ile_wplat=ile_wplat,
+            wysokosc_wplat=wysokosc_wplat, zalozenia=zalozenia, lokata=lokata)
+        df_konto = sesja.konto()
+        df_roczne = sesja.zestawienie_roczne()
+        return aplikuj_style(df=df_konto), aplikuj_style(df=df_roczne), \
+            df_konto, df_roczne
+    if silnik != SILNIK_REFERENCYJNY:
+        raise ValueError(f"Nieznany silnik symulacji: {silnik}")
+
+    daty_wplat = daty_wplat_konta(data_startu=data_startu, ile_wplat=ile_wplat)
     df_konto = DataFrame(data={
         MIESIAC: daty_wplat,
         WPLATA: [wysokosc_wplat] * ile_wplat
@@ -296,34 +339,8 @@ def symulacja_konta(data_startu: str,
         ]
     )
 
-    df_konto_cols = \
-        multicols(GR_KOL_WPLATY,
-                  [MIESIAC,
-                   ROK,
-                   WPLATA,
-                   WPLATA_TOTAL]) + \
-        multicols(GR_KOL_ODSETKI,
-                  [ODSETKI_BANKU_PCT,
-                   ODSETKI_BANKU_ABS,
-                   ODSETKI_BANKU_TOTAL]) + \
-        multicols(GR_KOL_PREMIA,
-                  [PREMIA_SKLADNIK_NALICZ,
-                   PREMIA_TOTAL,
-                   PREMIA_BEZ_PROWIZJI]) + \
-        multicols(GR_KOL_TOTALS,
-                  [TOTAL_Z_PREMIA,
-                   TOTAL_Z_ODSETKAMI_I_PREMIA_BEZ_PROWIZJI])
-    df_konto.columns = pd.MultiIndex.from_tuples(df_konto_cols)
-
-    df_roczne_cols = \
-        multicols(GR_KOL_WPLATY, [WPLATA_TOTAL]) + \
-        multicols(GR_KOL_ODSETKI, [ODSETKI_BANKU_TOTAL]) + \
-        multicols(GR_KOL_PREMIA, [PREMIA_TOTAL, PREMIA_BEZ_PROWIZJI]) + \
-        multicols(GR_KOL_TOTALS, [
-            TOTAL_Z_ODSETKAMI_I_PREMIA_BEZ_PROWIZJI
-        ])
-
-    df_roczne.columns = pd.MultiIndex.from_tuples(df_roczne_cols)
+    df_konto.columns = pd.MultiIndex.from_tuples(KOLUMNY_KONTA)
+    df_roczne.columns = pd.MultiIndex.from_tuples(KOLUMNY_ROCZNE)
 
     df_konto_styled = aplikuj_style(df=df_konto)
     df_roczne_styled = aplikuj_style(df=df_roczne)
@@ -358,6 +375,27 @@ def rysuj_wykres_lokaty(df_konto):
     plt.show()
 
 
+def oprocentowanie_wplat(
+        daty: pd.DatetimeIndex,
+        procent_wplaty: Callable[[pd.Timestamp, int, pd.Timestamp], Procent]
+) -> DataFrame:
+    """
+    Zwraca oprocentowanie lokaty złożone z oprocentowania kolejnych wpłat.
+
+    Args:
+        daty (pd.DatetimeIndex): daty poszczególnych wpłat
+        procent_wplaty (Callable): oprocentowanie pojedynczej wpłaty, jak
+            `Bank.oprocentowanie_wplaty`
+
+    Returns:
+        DataFrame: jedna kolumna 'Odsetki' typu Procent/ProcentInflacji
+    """
+    return DataFrame(data={
+        'Odsetki': [procent_wplaty(daty[0], wplata_nr, data_wplaty)
+                    for wplata_nr, data_wplaty in enumerate(daty, 1)]
+    }, index=pd.Index(range(1, len(daty) + 1)))
+
+
 def odsetki_bankowe_pekao(daty: pd.DatetimeIndex) -> DataFrame:
     """
     Zwraca oprocentowanie lokaty w banku Pekao.
@@ -376,32 +414,34 @@ def odsetki_bankowe_pekao(daty: pd.DatetimeIndex) -> DataFrame:
     Returns:
         DataFrame: jedna kolumna 'Odsetki' typu Procent/ProcentInflacji
     """
+    return oprocentowanie_wplat(daty, procent_wplaty_pekao)
 
-    data_3pct = pd.Timestamp(2024, 7, 9)
-    pct5 = Procent(5.0)
-    pct3 = Procent(3.0)
-    pct1_7th_infl = ProcentInflacji(100.0 * 1.0 / 7.0)
-
-    if daty[0] < pd.Timestamp(2023, 11, 1):  # założona przed końcem 2023-10-31
-        ile_5pct = 6  # pierwsze 6 miesięcy oprocentowanie 5%
-        # kolejne raty 3% do 2024-07-08 (zakładam, że włącznie)
-        ile_3pct = np.count_nonzero(daty[6:] < data_3pct)
-        # reszta rat 1/7 inflacji
-        reszta = np.count_nonzero(daty[6:] > data_3pct)
-    else:
-        ile_5pct = 0
-        # raty 3% do 2024-07-08 (zakładam, że włącznie)
-        ile_3pct = np.count_nonzero(daty < data_3pct)
-        # reszta rat 1/7 inflacji
-        reszta = np.count_nonzero(daty > data_3pct)
-
-    pct = [pct5] * ile_5pct + [pct3] * ile_3pct + [pct1_7th_infl] * reszta
-    return DataFrame(data={
-        'Odsetki': pct
-    }, index=pd.Index(range(1, len(daty) + 1)))
 
+def procent_wplaty_pekao(data_pierwszej_wplaty: pd.Timestamp,
+                         wplata_nr: int,
+                         data_wplaty: pd.Timestamp) -> Procent:
+    """
+    Zwraca oprocentowanie pojedynczej wpłaty w banku Pekao.
 
-PEKAO = Bank(name="Pekao", oprocentowanie_lokaty=odsetki_bankowe_pekao)
+    Reguły jak w `odsetki_bankowe_pekao`.
+
+    Args:
+        data_pierwszej_wplaty (pd.Timestamp): data założenia lokaty
+        wplata_nr (int): numer wpłaty (od 1)
+        data_wplaty (pd.Timestamp): data tej wpłaty
+
+    Returns:
+        Procent: oprocentowanie typu Procent/ProcentInflacji
+    """
+    if data_pierwszej_wplaty < pd.Timestamp(2023, 11, 1) and wplata_nr <= 6:
+        return Procent(5.0)
+    if data_wplaty < pd.Timestamp(2024, 7, 9):
+        return Procent(3.0)
+    return ProcentInflacji(100.0 * 1.0 / 7.0)
+
+
+PEKAO = Bank(name="Pekao", oprocentowanie_lokaty=odsetki_bankowe_pekao,
+             oprocentowanie_wplaty=procent_wplaty_pekao)
 
 
 def odsetki_bankowe_alior(daty: pd.DatetimeIndex) -> DataFrame:
@@ -420,20 +460,34 @@ def odsetki_bankowe_alior(daty: pd.DatetimeIndex) -> DataFrame:
     Returns:
         DataFrame: jedna kolumna 'Odsetki' typu Procent/ProcentInflacji
     """
+    return oprocentowanie_wplat(daty, procent_wplaty_alior)
 
-    data_promocji = pd.Timestamp(2024, 1, 1)
-    ile_5pct = np.count_nonzero(daty < data_promocji)
-    ile_reszty = len(daty) - ile_5pct
-    pct5 = Procent(5)
-    pct1_6th_infl = ProcentInflacji(100.0 * 1.0 / 6.0)
 
-    pct = [pct5] * ile_5pct + [pct1_6th_infl] * ile_reszty
-    return DataFrame(data={
-        'Odsetki': pct
-    }, index=pd.Index(range(1, len(daty) + 1)))
+def procent_wplaty_alior(data_pierwszej_wplaty: pd.Timestamp,
+                         wplata_nr: int,
+                         data_wplaty: pd.Timestamp) -> Procent:
+    """
+    Zwraca oprocentowanie pojedynczej wpłaty w banku Alior.
+
+    Reguły jak w `odsetki_bankowe_alior`.
+
+    Args:
+        data_pierwszej_wplaty (pd.Timestamp): data założenia lokaty
+        wplata_nr (int): numer wpłaty (od 1)
+        data_wplaty (pd.Timestamp): data tej wpłaty
+
+    Returns:
+        Procent: oprocentowanie typu Procent/ProcentInflacji
+    """
+    if data_wplaty < pd.Timestamp(2024, 1, 1):
+        return Procent(5)
+    return ProcentInflacji(100.0 * 1.0 / 6.0)
 
 
-ALIOR = Bank(name="Pekao", oprocentowanie_lokaty=odsetki_bankowe_alior)
+ALIOR = Bank(name="Alior", oprocentowanie_lokaty=odsetki_bankowe_alior,
+             oprocentowanie_wplaty=procent_wplaty_alior)
+
+BANKI = {bank.name: bank for bank in [PEKAO, ALIOR]}
 
 
 def licz_odsetki_procent_zlozony(
@@ -483,13 +537,751 @@ def licz_odsetki_procent_zlozony(
     return DataFrame(data=total, index=index)
 
 
+def daty_wplat_konta(data_startu: str, ile_wplat: int) -> pd.DatetimeIndex:
+    return pd.date_range(
+        start=data_startu,
+        periods=ile_wplat,
+        freq=pd.offsets.MonthBegin()
+    )
+
+
+def indeksy_lat_zalozen(daty: pd.DatetimeIndex,
+                        zalozenia: DataFrame) -> np.ndarray:
+    """
+    Mapuje daty wpłat na pozycje wierszy w założeniach.
+
+    Args:
+        daty (pd.DatetimeIndex): daty poszczególnych wpłat
+        zalozenia (DataFrame): założenia inflacji i wzrostu m2 na dany rok
+
+    Raises:
+        KeyError: gdy założenia nie obejmują roku którejś z wpłat
+
+    Returns:
+        np.ndarray: pozycja roku danej wpłaty w indeksie założeń
+    """
+    lata = pd.PeriodIndex(daty.year.astype(str), freq='Y')
+    indeksy = zalozenia.index.get_indexer(lata)
+    if (indeksy < 0).any():
+        brakujace = sorted(set(lata[indeksy < 0].astype(str)))
+        raise KeyError(f"Brak założeń dla lat: {', '.join(brakujace)}")
+    return indeksy
+
+
+def tablice_oprocentowania(daty: pd.DatetimeIndex,
+                           lokata: Bank | None) -> Tuple[np.ndarray,
+                                                         np.ndarray]:
+    """
+    Zamienia oprocentowanie lokaty na tablice numpy.
+
+    Args:
+        daty (pd.DatetimeIndex): daty poszczególnych wpłat
+        lokata (Bank | None): bank prowadzący konto
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: oprocentowanie nominalne (lub jako
+        ułamek inflacji) oraz maska wpłat oprocentowanych względem inflacji
+    """
+    if not lokata:
+        return np.zeros(len(daty)), np.zeros(len(daty), dtype=bool)
+    return tablice_procentow(lokata.oprocentowanie_lokaty(daty).iloc[:, 0])
+
+
+def tablice_procentow(
+        procenty: Iterable[Procent]) -> Tuple[np.ndarray, np.ndarray]:
+    procenty = list(procenty)
+    pct = np.array([p.pct for p in procenty], dtype=float)
+    inflacyjne = np.array([isinstance(p, ProcentInflacji) for p in procenty],
+                          dtype=bool)
+    return pct, inflacyjne
+
+
+def saldo_procent_zlozony(wplaty: np.ndarray,
+                          oprocentowanie: np.ndarray,
+                          saldo_poczatkowe: float = 0) -> np.ndarray:
+    """
+    Wektorowy odpowiednik `licz_odsetki_procent_zlozony`.
+
+    Saldo po wpłacie t to suma wpłat s <= t pomnożonych przez czynniki
+    (1 + r/12) od miesiąca s do t włącznie (kapitalizacja miesięczna, wpłata
+    na początku miesiąca).
+
+    Args:
+        wplaty (np.ndarray): wpłaty w poszczególnych miesiącach
+        oprocentowanie (np.ndarray): efektywne roczne oprocentowanie lokaty
+        saldo_poczatkowe (float): saldo lokaty przed pierwszą z wpłat
+
+    Returns:
+        np.ndarray: saldo lokaty po kolejnych wpłatach
+    """
+    czynnik = 1 + oprocentowanie / 12
+    wzrost = np.cumprod(czynnik, axis=-1)
+    return wzrost * (np.asarray(saldo_poczatkowe)[..., np.newaxis] +
+                     np.cumsum(wplaty * czynnik / wzrost, axis=-1))
+
+
+def wrazliwosc_na_zalozenia(data_startu: str,
+                            ile_wplat: int,
+                            wysokosc_wplat: int,
+                            zalozenia: DataFrame,
+                            lokata: Bank) -> DataFrame:
+    """
+    Oblicza wrażliwość wyniku końcowego na założenia poszczególnych lat.
+
+    Zwraca pochodne cząstkowe końcowej wartości
+    TOTAL_Z_ODSETKAMI_I_PREMIA_BEZ_PROWIZJI względem inflacji i wzrostu cen m2
+    każdego roku założeń, liczone analitycznie w jednym przebiegu:
+    - premia: d(S_t * P_rok / 12), gdzie P_rok jest obcięte do [1%, 15%]
+      (art. 14.4 ustawy) i jest większym z obu wskaźników (art. 14.3 ustawy),
+    - odsetki: d(saldo końcowe) / d(r_t) dla oprocentowania typu
+      ProcentInflacji.
+    W punktach załamania (obcięcie, równe wskaźniki) zwracana jest pochodna
+    prawostronna.  Lata spoza horyzontu symulacji mają pochodną 0.
+
+    Args:
+        data_startu (str): data pierwszej wpłaty
+        ile_wplat (int): liczba miesięcznych wpłat
+        wysokosc_wplat (int): wysokość miesięcznej wpłaty
+        zalozenia (DataFrame): założenia inflacji i wzrostu m2 na dany rok
+        lokata (Bank): bank prowadzący konto
+
+    Returns:
+        DataFrame: indeks jak w założeniach (ROK), kolumny INFLACJA i
+        WZROST_M2 z pochodnymi wyniku końcowego (w zł na jednostkę wskaźnika)
+    """
+    daty = daty_wplat_konta(data_startu=data_startu, ile_wplat=ile_wplat)
+    lata = indeksy_lat_zalozen(daty, zalozenia)
+    wplaty = np.full(ile_wplat, float(wysokosc_wplat))
+    suma_wplat = np.cumsum(wplaty)
+
+    inflacja = zalozenia[INFLACJA].to_numpy(dtype=float)
+    wzrost_m2 = pd.to_numeric(
+        zalozenia[WZROST_M2], errors='coerce').fillna(0).to_numpy()
+    wskaznik = np.maximum(inflacja, wzrost_m2)
+    w_przedziale = (wskaznik >= 0.01) & (wskaznik < 0.15)
+    d_premia_d_inflacja = (inflacja >= wzrost_m2) & w_przedziale
+    d_premia_d_wzrost_m2 = (wzrost_m2 >= inflacja) & w_przedziale
+
+    # d(suma składników premii bez prowizji) / d(P_rok)
+    naliczane = suma_wplat / 12
+    if np.count_nonzero(lata == lata[0]) < 9:  # art. 14.1 ustawy
+        naliczane = np.where(lata == lata[0], 0.0, naliczane)
+    d_total_d_premia = oblicz_premie_bez_prowizji_banku(
+        np.bincount(lata, weights=naliczane, minlength=len(zalozenia)))
+
+    # d(saldo końcowe) / d(r_t) = (saldo_{t-1} + wpłata_t) / 12 *
+    #                             prod_{s > t} (1 + r_s / 12)
+    pct, inflacyjne = tablice_oprocentowania(daty, lokata)
+    oprocentowanie = np.where(inflacyjne, pct * inflacja[lata], pct)
+    czynnik = 1 + oprocentowanie / 12
+    saldo = saldo_procent_zlozony(wplaty, oprocentowanie)
+    wzrost_do_konca = np.cumprod(czynnik[::-1])[::-1] / czynnik
+    d_saldo_d_r = saldo / czynnik / 12 * wzrost_do_konca
+    d_total_d_odsetki = np.bincount(
+        lata, weights=np.where(inflacyjne, d_saldo_d_r * pct, 0.0),
+        minlength=len(zalozenia))
+
+    return DataFrame(data={
+        INFLACJA: d_total_d_odsetki + d_total_d_premia * d_premia_d_inflacja,
+        WZROST_M2: d_total_d_premia * d_premia_d_wzrost_m2,
+    }, index=zalozenia.index)
+
+
+def przelicz_tablice_konta(wplaty: np.ndarray,
+                           suma_wplat: np.ndarray,
+                           z_premia: np.ndarray,
+                           lata: np.ndarray,
+                           pct: np.ndarray,
+                           inflacyjne: np.ndarray,
+                           zalozenia: DataFrame,
+                           poprzednia_premia: float = 0.0,
+                           poprzednie_saldo: float = 0.0) -> Tuple[np.ndarray,
+                                                                   np.ndarray,
+                                                                   np.ndarray,
+                                                                   np.ndarray]:
+    """
+    Oblicza premię i saldo lokaty dla kolejnych wpłat.
+
+    Args:
+        wplaty (np.ndarray): wpłaty w poszczególnych miesiącach
+        suma_wplat (np.ndarray): suma bieżąca po kolejnych wpłatach
+        z_premia (np.ndarray): maska wpłat, od których należy się premia
+        lata (np.ndarray): pozycje lat wpłat w założeniach
+        pct (np.ndarray): oprocentowanie lokaty (lub ułamek inflacji)
+        inflacyjne (np.ndarray): maska oprocentowania względem inflacji
+        zalozenia (DataFrame): założenia inflacji i wzrostu m2 na dany rok
+        poprzednia_premia (float): premia sumaryczna przed pierwszą z wpłat
+        poprzednie_saldo (float): saldo lokaty przed pierwszą z wpłat
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: składniki
+        naliczeniowe premii, premia sumaryczna, efektywne oprocentowanie i
+        saldo lokaty
+    """
+    premia = zalozenia[PREMIA].to_numpy(dtype=float)[lata]
+    inflacja = zalozenia[INFLACJA].to_numpy(dtype=float)[lata]
+    skladnik_premii = np.where(
+        z_premia,
+        oblicz_skladnik_naliczeniowy(suma_wplat=suma_wplat, premia=premia),
+        0.0)
+    premia_total = np.cumsum(np.append(poprzednia_premia, skladnik_premii))[1:]
+    oprocentowanie = np.where(inflacyjne, pct * inflacja, pct)
+    saldo = saldo_procent_zlozony(wplaty=wplaty, oprocentowanie=oprocentowanie,
+                                  saldo_poczatkowe=poprzednie_saldo)
+    return skladnik_premii, premia_total, oprocentowanie, saldo
+
+
+def zestawienie_miesieczne(daty: pd.DatetimeIndex,
+                           wplaty: np.ndarray,
+                           suma_wplat: np.ndarray,
+                           oprocentowanie: np.ndarray,
+                           saldo: np.ndarray,
+                           skladnik_premii: np.ndarray,
+                           premia_total: np.ndarray,
+                           pierwsza_wplata_nr: int = 1,
+                           poprzednie_odsetki: float = 0.0) -> DataFrame:
+    """
+    Składa tablice symulacji w zestawienie miesięczne `symulacja_konta`.
+
+    Args:
+        daty (pd.DatetimeIndex): daty poszczególnych wpłat
+        wplaty (np.ndarray): wpłaty w poszczególnych miesiącach
+        suma_wplat (np.ndarray): suma bieżąca po kolejnych wpłatach
+        oprocentowanie (np.ndarray): efektywne roczne oprocentowanie lokaty
+        saldo (np.ndarray): saldo lokaty po kolejnych wpłatach
+        skladnik_premii (np.ndarray): składniki naliczeniowe premii
+        premia_total (np.ndarray): premia sumaryczna po kolejnych wpłatach
+        pierwsza_wplata_nr (int): numer pierwszej wpłaty (od 1)
+        poprzednie_odsetki (float): suma odsetek przed pierwszą z wpłat
+
+    Returns:
+        DataFrame: zestawienie miesięczne z kolumnami KOLUMNY_KONTA
+    """
+    odsetki_total = saldo - suma_wplat
+    premia_bez_prowizji = oblicz_premie_bez_prowizji_banku(premia_total)
+    df_konto = DataFrame(data={
+        MIESIAC: daty,
+        ROK: daty.year,
+        WPLATA: wplaty,
+        WPLATA_TOTAL: suma_wplat,
+        ODSETKI_BANKU_PCT: oprocentowanie,
+        ODSETKI_BANKU_ABS: np.diff(odsetki_total, prepend=poprzednie_odsetki),
+        ODSETKI_BANKU_TOTAL: odsetki_total,
+        PREMIA_SKLADNIK_NALICZ: skladnik_premii,
+        PREMIA_TOTAL: premia_total,
+        PREMIA_BEZ_PROWIZJI: premia_bez_prowizji,
+        TOTAL_Z_PREMIA: suma_wplat + premia_total,
+        TOTAL_Z_ODSETKAMI_I_PREMIA_BEZ_PROWIZJI:
+            suma_wplat + odsetki_total + premia_bez_prowizji,
+    }, index=pd.Index(
+        range(pierwsza_wplata_nr, pierwsza_wplata_nr + len(daty)),
+        name=WPLATA_NR))
+    df_konto.columns = pd.MultiIndex.from_tuples(KOLUMNY_KONTA)
+    return df_konto
+
+
+class SesjaSymulacji:
+    """
+    Sesja "co jeśli" do interaktywnych zmian założeń symulacji konta.
+
+    Przechowuje pośrednie tablice symulacji: mapowanie wpłat na lata założeń,
+    składniki premii, efektywne oprocentowanie, saldo lokaty i zestawienie
+    roczne.  Procent składany i premia sumaryczna to rekurencje w przód, więc
+    zmiana założeń przelicza tylko miesiące od pierwszej dotkniętej wpłaty i
+    wiersze zestawienia rocznego od jej roku.
+    """
+
+    def __init__(self,
+                 data_startu: str,
+                 ile_wplat: int,
+                 wysokosc_wplat: int,
+                 zalozenia: DataFrame,
+                 lokata: Bank) -> None:
+        self.zalozenia = zalozenia.copy()
+        self.daty = daty_wplat_konta(data_startu=data_startu,
+                                     ile_wplat=ile_wplat)
+        self.lata = indeksy_lat_zalozen(self.daty, self.zalozenia)
+        self.wplaty = np.full(ile_wplat, wysokosc_wplat)
+        self.suma_wplat = np.cumsum(self.wplaty)
+        # premia za pierwszy rok nie przysługuje, jeśli było w nim mniej niż
+        # 9 wpłat (art. 14.1 ustawy)
+        self.z_premia = np.ones(ile_wplat, dtype=bool)
+        if np.count_nonzero(self.lata == self.lata[0]) < 9:
+            self.z_premia[self.lata == self.lata[0]] = False
+        self.pct, self.inflacyjne = tablice_oprocentowania(self.daty, lokata)
+        self.konce_lat = np.flatnonzero(np.diff(self.lata, append=-1))
+
+        self.skladnik_premii = np.zeros(ile_wplat)
+        self.premia_total = np.zeros(ile_wplat)
+        self.oprocentowanie = np.zeros(ile_wplat)
+        self.saldo = np.zeros(ile_wplat)
+        self.roczne = np.zeros((len(self.konce_lat), len(KOLUMNY_ROCZNE)))
+        self._przelicz(od=0)
+
+    def zmien_inflacje(self, rok: str | int, inflacja: float) -> None:
+        self._zmien_zalozenia(rok=rok, kolumna=INFLACJA, wartosc=inflacja)
+
+    def zmien_wzrost_m2(self, rok: str | int, wzrost_m2: float) -> None:
+        self._zmien_zalozenia(rok=rok, kolumna=WZROST_M2, wartosc=wzrost_m2)
+
+    def zmien_oprocentowanie(self,
+                             wplata_nr: int,
+                             procent: Procent,
+                             ile_wplat: int = 1) -> None:
+        """
+        Zmienia oprocentowanie lokaty dla kolejnych wpłat.
+
+        Args:
+            wplata_nr (int): numer pierwszej zmienianej wpłaty (od 1)
+            procent (Procent): nowe oprocentowanie (Procent/ProcentInflacji)
+            ile_wplat (int): liczba kolejnych wpłat z nowym oprocentowaniem
+        """
+        od = wplata_nr - 1
+        self.pct[od:od + ile_wplat] = procent.pct
+        self.inflacyjne[od:od + ile_wplat] = isinstance(
+            procent, ProcentInflacji)
+        self._przelicz(od=od)
+
+    def wartosc_koncowa(self) -> float:
+        return self.roczne[-1, -1]
+
+    def konto(self, od: int = 0, ile: int | None = None) -> DataFrame:
+        """
+        Zwraca zestawienie miesięczne w formacie `symulacja_konta`.
+
+        Args:
+            od (int): indeks pierwszej zwracanej wpłaty (od 0)
+            ile (int | None): liczba zwracanych wpłat, domyślnie do końca
+
+        Returns:
+            DataFrame: wiersze zestawienia miesięcznego dla wybranych wpłat
+        """
+        okno = slice(od, None if ile is None else od + ile)
+        return zestawienie_miesieczne(
+            daty=self.daty[okno], wplaty=self.wplaty[okno],
+            suma_wplat=self.suma_wplat[okno],
+            oprocentowanie=self.oprocentowanie[okno], saldo=self.saldo[okno],
+            skladnik_premii=self.skladnik_premii[okno],
+            premia_total=self.premia_total[okno], pierwsza_wplata_nr=od + 1,
+            poprzednie_odsetki=self.saldo[od - 1] - self.suma_wplat[od - 1]
+            if od else 0.0)
+
+    def zestawienie_roczne(self) -> DataFrame:
+        """
+        Zwraca zestawienie roczne w formacie `symulacja_konta`.
+        """
+        df_roczne = DataFrame(
+            data=self.roczne,
+            index=pd.Index(self.daty.year[self.konce_lat], name=ROK),
+            columns=pd.MultiIndex.from_tuples(KOLUMNY_ROCZNE))
+        df_roczne[KOL_WPLATA_TOTAL] = self.suma_wplat[self.konce_lat]
+        return df_roczne
+
+    def _zmien_zalozenia(self,
+                         rok: str | int,
+                         kolumna: str,
+                         wartosc: float) -> None:
+        wiersz = self.zalozenia.index.get_loc(str(rok))
+        self.zalozenia.iloc[
+            wiersz, self.zalozenia.columns.get_loc(kolumna)] = wartosc
+        self.zalozenia.iloc[
+            wiersz, self.zalozenia.columns.get_loc(PREMIA)] = \
+            roczny_wskaznik_premii(
+                self.zalozenia[INFLACJA].iloc[wiersz],
+                self.zalozenia[WZROST_M2].iloc[wiersz] or 0)
+        self._przelicz(od=np.searchsorted(self.lata, wiersz))
+
+    def _przelicz(self, od: int) -> None:
+        """
+        Przelicza tablice od wpłaty o indeksie `od` (od 0) do końca.
+        """
+        if od >= len(self.daty):
+            return
+        (self.skladnik_premii[od:],
+         self.premia_total[od:],
+         self.oprocentowanie[od:],
+         self.saldo[od:]) = przelicz_tablice_konta(
+            wplaty=self.wplaty[od:], suma_wplat=self.suma_wplat[od:],
+            z_premia=self.z_premia[od:], lata=self.lata[od:],
+            pct=self.pct[od:], inflacyjne=self.inflacyjne[od:],
+            zalozenia=self.zalozenia,
+            poprzednia_premia=self.premia_total[od - 1] if od else 0.0,
+            poprzednie_saldo=self.saldo[od - 1] if od else 0.0)
+
+        # zestawienie roczne: wiersze od roku wpłaty `od`
+        wiersz = np.searchsorted(self.konce_lat, od)
+        konce = self.konce_lat[wiersz:]
+        premia_bez_prowizji = oblicz_premie_bez_prowizji_banku(
+            self.premia_total[konce])
+        self.roczne[wiersz:] = np.column_stack([
+            self.suma_wplat[konce],
+            self.saldo[konce] - self.suma_wplat[konce],
+            self.premia_total[konce],
+            premia_bez_prowizji,
+            self.saldo[konce] + premia_bez_prowizji,
+        ])
+
+
+def symulacja_konta_wsadowa(data_startu: str,
+                            ile_wplat: int,
+                            wysokosci_wplat: list[int],
+                            zalozenia: DataFrame,
+                            lokata: Bank) -> DataFrame:
+    """
+    Oblicza końcowy stan konta dla wielu wysokości wpłat naraz.
+
+    Wszystkie kwoty symulacji są liniowe względem wysokości stałej wpłaty,
+    więc wystarcza jedna symulacja dla wpłat po 1 zł przeskalowana przez
+    kolejne wysokości wpłat.
+
+    Args:
+        data_startu (str): data pierwszej wpłaty
+        ile_wplat (int): liczba miesięcznych wpłat
+        wysokosci_wplat (list[int]): wysokości miesięcznej wpłaty
+        zalozenia (DataFrame): założenia inflacji i wzrostu m2 na dany rok
+        lokata (Bank): bank prowadzący konto
+
+    Returns:
+        DataFrame: indeks WPLATA, kolumny jak w zestawieniu rocznym
+        `symulacja_konta` (bez grup kolumn) dla ostatniej wpłaty
+    """
+    sesja = SesjaSymulacji(
+        data_startu=data_startu, ile_wplat=ile_wplat, wysokosc_wplat=1,
+        zalozenia=zalozenia, lokata=lokata)
+    wysokosci_wplat = np.asarray(wysokosci_wplat)
+    return DataFrame(
+        data=np.outer(wysokosci_wplat, sesja.roczne[-1]),
+        index=pd.Index(wysokosci_wplat, name=WPLATA),
+        columns=[kolumna for _, kolumna in KOLUMNY_ROCZNE])
+
+
+class StanKonta(NamedTuple):
+    """
+    Stan konta po jednej wpłacie, pola jak w KOLUMNY_KONTA.
+    """
+    wplata_nr: int
+    miesiac: pd.Timestamp
+    rok: int
+    wplata: int
+    suma_wplat: int
+    odsetki_banku_pct: float
+    odsetki_banku: float
+    suma_odsetek_banku: float
+    skladnik_premii: float
+    premia_total: float
+    premia_bez_prowizji: float
+    total_z_premia: float
+    total: float
+
+
+def symulacja_konta_porcjami(data_startu: str,
+                             wysokosc_wplat: int,
+                             zalozenia: DataFrame,
+                             lokata: Bank,
+                             ile_wplat: int | None = None,
+                             rozmiar_porcji: int = 120) -> Iterator[DataFrame]:
+    """
+    Leniwie liczy zestawienie miesięczne konta w porcjach stałej wielkości.
+
+    Pamięć nie zależy od horyzontu: między porcjami przenoszone są tylko suma
+    wpłat, premia sumaryczna i saldo lokaty.  Oprocentowanie banków z
+    `oprocentowanie_wplaty` liczone jest dla każdej wpłaty osobno, dla
+    pozostałych banków - z góry dla całego horyzontu.
+
+    Args:
+        data_startu (str): data pierwszej wpłaty
+        wysokosc_wplat (int): wysokość miesięcznej wpłaty
+        zalozenia (DataFrame): założenia inflacji i wzrostu m2 na dany rok
+        lokata (Bank): bank prowadzący konto
+        ile_wplat (int | None): liczba wpłat, domyślnie do końca ostatniego
+            roku założeń
+        rozmiar_porcji (int): liczba wpłat w jednej porcji
+
+    Yields:
+        DataFrame: kolejne wiersze zestawienia miesięcznego `symulacja_konta`
+    """
+    pierwsza_data = daty_wplat_konta(data_startu=data_startu, ile_wplat=1)[0]
+    if ile_wplat is None:
+        ile_wplat = (zalozenia.index[-1].year - pierwsza_data.year) * 12 + \
+            13 - pierwsza_data.month
+    # premia za pierwszy rok nie przysługuje, jeśli było w nim mniej niż 9
+    # wpłat (art. 14.1 ustawy)
+    premia_za_pierwszy_rok = min(ile_wplat, 13 - pierwsza_data.month) >= 9
+    if lokata and not lokata.oprocentowanie_wplaty:
+        pct_wplat, inflacyjne_wplat = tablice_oprocentowania(
+            daty_wplat_konta(data_startu=data_startu, ile_wplat=ile_wplat),
+            lokata)
+
+    suma_wplat, premia_total, saldo = 0, 0.0, 0.0
+    for od in range(0, ile_wplat, rozmiar_porcji):
+        daty = daty_wplat_konta(
+            data_startu=pierwsza_data + pd.DateOffset(months=od),
+            ile_wplat=min(rozmiar_porcji, ile_wplat - od))
+        if not lokata:
+            pct, inflacyjne = tablice_oprocentowania(daty, lokata)
+        elif lokata.oprocentowanie_wplaty:
+            pct, inflacyjne = tablice_procentow([
+                lokata.oprocentowanie_wplaty(pierwsza_data, nr, data)
+                for nr, data in enumerate(daty, start=od + 1)])
+        else:
+            pct = pct_wplat[od:od + len(daty)]
+            inflacyjne = inflacyjne_wplat[od:od + len(daty)]
+        wplaty = np.full(len(daty), wysokosc_wplat)
+        sumy_wplat = suma_wplat + np.cumsum(wplaty)
+        skladniki_premii, premie_total, oprocentowanie, salda = \
+            przelicz_tablice_konta(
+                wplaty=wplaty, suma_wplat=sumy_wplat,
+                z_premia=premia_za_pierwszy_rok |
+                (daty.year != pierwsza_data.year),
+                lata=indeksy_lat_zalozen(daty, zalozenia),
+                pct=pct, inflacyjne=inflacyjne, zalozenia=zalozenia,
+                poprzednia_premia=premia_total, poprzednie_saldo=saldo)
+        yield zestawienie_miesieczne(
+            daty=daty, wplaty=wplaty, suma_wplat=sumy_wplat,
+            oprocentowanie=oprocentowanie, saldo=salda,
+            skladnik_premii=skladniki_premii, premia_total=premie_total,
+            pierwsza_wplata_nr=od + 1, poprzednie_odsetki=saldo - suma_wplat)
+        suma_wplat, premia_total, saldo = \
+            sumy_wplat[-1], premie_total[-1], salda[-1]
+
+
+def symulacja_konta_miesiacami(data_startu: str,
+                               wysokosc_wplat: int,
+                               zalozenia: DataFrame,
+                               lokata: Bank,
+                               ile_wplat: int | None = None
+                               ) -> Iterator[StanKonta]:
+    """
+    Leniwie zwraca stan konta po kolejnych wpłatach.
+
+    Przykład - pierwszy miesiąc, w którym total przekracza 50 000 zł:
+        next(s for s in symulacja_konta_miesiacami(...) if s.total > 50_000)
+
+    Args:
+        jak w `symulacja_konta_porcjami`
+
+    Yields:
+        StanKonta: stan konta po kolejnej wpłacie
+    """
+    for df_porcja in symulacja_konta_porcjami(
+            data_startu=data_startu, wysokosc_wplat=wysokosc_wplat,
+            zalozenia=zalozenia, lokata=lokata, ile_wplat=ile_wplat,
+            rozmiar_porcji=12):
+        for wiersz in df_porcja.itertuples(name=None):
+            yield StanKonta(*wiersz)
+
+
+class Scenariusz(NamedTuple):
+    """
+    Pojedynczy scenariusz symulacji; repr pozwala go odtworzyć.
+    """
+    data_startu: str
+    ile_wplat: int
+    wysokosc_wplat: int
+    inflacja: Tuple[float, ...]
+    wzrost_m2: Tuple[float | None, ...] | None
+    bank: str | None
+
+    def zalozenia(self) -> DataFrame:
+        pierwsza_data = daty_wplat_konta(
+            data_startu=self.data_startu, ile_wplat=1)[0]
+        return zalozenia_inflacji_i_wzrostu_m2(
+            data_startu=str(pierwsza_data.year), inflacja=list(self.inflacja),
+            wzrost_m2=list(self.wzrost_m2) if self.wzrost_m2 else None)
+
+    def symulacja(self,
+                  silnik: str = SILNIK_REFERENCYJNY) -> (DataFrame,
+                                                         DataFrame):
+        _, _, df_konto, df_roczne = symulacja_konta(
+            data_startu=self.data_startu, ile_wplat=self.ile_wplat,
+            wysokosc_wplat=self.wysokosc_wplat, zalozenia=self.zalozenia(),
+            lokata=BANKI[self.bank] if self.bank else None, silnik=silnik)
+        return df_konto, df_roczne
+
+
+def losowy_scenariusz(rng: np.random.Generator) -> Scenariusz:
+    """
+    Losuje scenariusz obejmujący przypadki brzegowe symulacji.
+
+    Daty startu od 2023 do 2026 (w tym nie od 1. dnia miesiąca) obejmują
+    progi Pekao 2023-11-01 i 2024-07-09, promocję Alior do końca 2023 oraz
+    pierwszy rok z mniej i co najmniej 9 wpłatami (art. 14.1 ustawy).
+    Inflacja i wzrost m2 wychodzą poza przedział 1%-15% (art. 14.4 ustawy),
+    wzrost m2 bywa None w całości lub dla pojedynczych lat.
+
+    Args:
+        rng (np.random.Generator): generator liczb losowych
+
+    Returns:
+        Scenariusz: losowy scenariusz
+    """
+    data_startu = pd.Timestamp(2023, 1, 1) + pd.Timedelta(
+        days=int(rng.integers(0, 4 * 365)))
+    if rng.random() < 0.5:
+        data_startu = data_startu.replace(day=1)
+    ile_wplat = int(rng.integers(6, 241))
+    ostatnia_data = daty_wplat_konta(
+        data_startu=data_startu, ile_wplat=ile_wplat)[-1]
+    pierwsza_data = daty_wplat_konta(data_startu=data_startu, ile_wplat=1)[0]
+    ile_lat = ostatnia_data.year - pierwsza_data.year + 1
+
+    def sciezka() -> Tuple[float, ...]:
+        return tuple(round(float(x), 4)
+                     for x in rng.uniform(-0.02, 0.2, size=ile_lat))
+
+    wzrost_m2 = None
+    if rng.random() < 0.7:
+        wzrost_m2 = tuple(None if rng.random() < 0.1 else x
+                          for x in sciezka())
+    return Scenariusz(
+        data_startu=data_startu.strftime('%Y-%m-%d'),
+        ile_wplat=ile_wplat,
+        wysokosc_wplat=int(rng.integers(1, 51)) * 100,
+        inflacja=sciezka(),
+        wzrost_m2=wzrost_m2,
+        bank=rng.choice([None, *BANKI]))
+
+
+def rozbieznosc_silnikow(scenariusz: Scenariusz,
+                         tolerancja: float = 1e-4) -> str | None:
+    """
+    Porównuje wyniki silnika referencyjnego i szybkiego dla scenariusza.
+
+    Zgodność oznacza ten sam wyjątek w obu silnikach albo te same zestawienia
+    z dokładnością do tolerancji.  Nie są porównywane typy kolumn: silnik
+    referencyjny zwraca int64 dla kolumny premii z samymi zerami (gdy
+    wszystkie wpłaty przypadają na pominięty pierwszy rok).  Domyślna
+    tolerancja to 0.01 grosza - `npf.fv` traci precyzję dla oprocentowania
+    bliskiego zeru.
+
+    Args:
+        scenariusz (Scenariusz): porównywany scenariusz
+        tolerancja (float): dopuszczalna różnica bezwzględna kwot
+
+    Returns:
+        str | None: opis rozbieżności lub None, gdy wyniki są zgodne
+    """
+    wyniki = []
+    for silnik in [SILNIK_REFERENCYJNY, SILNIK_SZYBKI]:
+        try:
+            wyniki.append(scenariusz.symulacja(silnik=silnik))
+        except Exception as e:
+            wyniki.append(e)
+    referencyjny, szybki = wyniki
+    if isinstance(referencyjny, Exception) or isinstance(szybki, Exception):
+        if type(referencyjny) is type(szybki):
+            return None
+        return f"{SILNIK_REFERENCYJNY}: {referencyjny!r}, " \
+            f"{SILNIK_SZYBKI}: {szybki!r}"
+    for df_referencyjny, df_szybki in zip(referencyjny, szybki):
+        try:
+            pd.testing.assert_frame_equal(
+                df_szybki, df_referencyjny, check_dtype=False,
+                check_exact=False, rtol=0, atol=tolerancja)
+        except AssertionError as e:
+            return str(e)
+    return None
+
+
+def minimalizuj_scenariusz(
+        scenariusz: Scenariusz,
+        rozbiezny: Callable[[Scenariusz], bool]) -> Scenariusz:
+    """
+    Upraszcza scenariusz tak długo, jak pozostaje rozbieżny.
+
+    Próbuje kolejno: krótszego horyzontu, założeń tylko dla lat horyzontu,
+    startu od 1. dnia miesiąca, wpłat po 1000 zł, braku wzrostu m2, stałej
+    inflacji i zaokrąglenia inflacji do 1 punktu procentowego.
+
+    Args:
+        scenariusz (Scenariusz): scenariusz rozbieżny
+        rozbiezny (Callable[[Scenariusz], bool]): czy scenariusz jest rozbieżny
+
+    Returns:
+        Scenariusz: najprostszy znaleziony scenariusz rozbieżny
+    """
+    def uproszczenia(s: Scenariusz) -> Iterator[Scenariusz]:
+        for ile_wplat in sorted({1, s.ile_wplat // 4, s.ile_wplat // 2,
+                                 s.ile_wplat * 3 // 4, s.ile_wplat - 1}):
+            yield s._replace(ile_wplat=max(ile_wplat, 1))
+        daty = daty_wplat_konta(data_startu=s.data_startu,
+                                ile_wplat=s.ile_wplat)
+        pierwsza_data = daty[0]
+        ile_lat = daty[-1].year - pierwsza_data.year + 1
+        yield s._replace(
+            inflacja=s.inflacja[:ile_lat],
+            wzrost_m2=s.wzrost_m2[:ile_lat] if s.wzrost_m2 else None)
+        yield s._replace(data_startu=pierwsza_data.strftime('%Y-%m-%d'))
+        yield s._replace(wysokosc_wplat=1000)
+        yield s._replace(wzrost_m2=None)
+        yield s._replace(inflacja=(s.inflacja[0],) * len(s.inflacja))
+        yield s._replace(inflacja=tuple(round(x, 2) for x in s.inflacja))
+
+    zmieniony = True
+    while zmieniony:
+        zmieniony = False
+        for kandydat in uproszczenia(scenariusz):
+            if kandydat != scenariusz and rozbiezny(kandydat):
+                scenariusz, zmieniony = kandydat, True
+                break
+    return scenariusz
+
+
+class Rozbieznosc(NamedTuple):
+    scenariusz: Scenariusz
+    opis: str
+
+
+def porownaj_silniki(ile_scenariuszy: int = 1000,
+                     ziarno: int | None = None,
+                     tolerancja: float = 1e-4) -> Rozbieznosc | None:
+    """
+    Porównuje silnik referencyjny i szybki na losowych scenariuszach.
+
+    Args:
+        ile_scenariuszy (int): liczba losowanych scenariuszy
+        ziarno (int | None): ziarno generatora liczb losowych
+        tolerancja (float): dopuszczalna różnica bezwzględna kwot
+
+    Returns:
+        Rozbieznosc | None: zminimalizowany scenariusz pierwszej rozbieżności
+        z jej opisem lub None, gdy wszystkie scenariusze są zgodne
+    """
+    rng = np.random.default_rng(ziarno)
+    for _ in range(ile_scenariuszy):
+        scenariusz = losowy_scenariusz(rng)
+        if rozbieznosc_silnikow(scenariusz, tolerancja=tolerancja):
+            scenariusz = minimalizuj_scenariusz(
+                scenariusz,
+                lambda s: rozbieznosc_silnikow(
+                    s, tolerancja=tolerancja) is not None)
+            return Rozbieznosc(
+                scenariusz=scenariusz,
+                opis=rozbieznosc_silnikow(scenariusz, tolerancja=tolerancja))
+    return None
+
+
 def wyswietl_symulacje(data_startu: str,
                        ile_wplat: int,
                        wysokosc_wplat: int,
                        zalozenia: DataFrame,
-                       lokata: Bank) -> None:
+                       lokata: Bank,
+                       od: int = 0,
+                       ile: int | None = None) -> None:
+    """
+    Wyświetla wykres, założenia oraz zestawienia roczne i miesięczne.
 
-    df_konto_styled, df_roczne_styled, df_konto, _ = symulacja_konta(
+    Args:
+        data_startu (str): miesiąc pierwszej wpłaty
+        ile_wplat (int): liczba miesięcznych wpłat
+        wysokosc_wplat (int): wysokość miesięcznej wpłaty
+        zalozenia (DataFrame): założenia inflacji i wzrostu cen m2
+        lokata (Bank): bank prowadzący konto
+        od (int): numer (od 0) pierwszej wpłaty w zestawieniu miesięcznym
+        ile (int | None): liczba wierszy zestawienia miesięcznego, domyślnie
+            wszystkie od `od`
+    """
+    _, df_roczne_styled, df_konto, _ = symulacja_konta(
         data_startu=data_startu, ile_wplat=ile_wplat,
         wysokosc_wplat=wysokosc_wplat, zalozenia=zalozenia, lokata=lokata)
 
@@ -511,4 +1303,5 @@ z wyliczoną premią miezkaniową dla tych założeń.
     display(HTML(f"""
 <h3>Zestawienie miesięczne wpłat, odsetek banku i premii mieszkaniowej</h3>
                  """))
-    display(df_konto_styled)
+    koniec = None if ile is None else od + ile
+    display(aplikuj_style(df=df_konto.iloc[od:koniec]))
@@ -0,0 +1,187 @@
+"""
+Interaktywny eksplorator symulacji konta mieszkaniowego dla notebooka.
+
+Użycie w notebooku:
+    from konmiesz_eksplorator import EksploratorSymulacji
+    EksploratorSymulacji(inflacja=[7.6, 4.3] + [2.5] * 9)
+
+Zamiast pełnych tabel stylowanych w wyjściu notebooka trzymana jest tylko
+sesja symulacji (`SesjaSymulacji`), a tabela miesięczna pokazuje wyłącznie
+widoczne okno wierszy liczone z jej tablic.  Zmiany suwaków są grupowane
+(debounce), a odświeżane są tylko części widoku, których dotyczy zmiana.
+"""
+
+import asyncio
+
+import ipywidgets as widgets
+import pandas as pd
+from IPython.display import display
+
+from konmiesz import (BANKI, PEKAO, SesjaSymulacji, aplikuj_style,
+                      rysuj_wykres_lokaty, zalozenia_inflacji_i_wzrostu_m2)
+
+# art. 4 ustawy: oszczędzanie od 3 do 10 lat, wpłaty od 500 do 2000 zł
+MIN_WPLAT = 3 * 12
+MAX_WPLAT = 10 * 12
+MIN_WYSOKOSC_WPLAT = 500
+MAX_WYSOKOSC_WPLAT = 2000
+# 120 wpłat może przypaść na 11 lat kalendarzowych
+MAX_LAT = MAX_WPLAT // 12 + 1
+MIESIACE_STARTU = pd.date_range(
+    start='2023-01', end='2027-12', freq=pd.offsets.MonthBegin()
+).strftime('%Y-%m').tolist()
+
+
+class EksploratorSymulacji:
+    """
+    Suwaki daty startu, wpłat, banku i inflacji w kolejnych latach.
+
+    Zmiana inflacji jednego roku przelicza sesję przyrostowo
+    (`SesjaSymulacji.zmien_inflacje`), pozostałe zmiany tworzą nową sesję.
+    Przewijanie tabeli miesięcznej odświeża tylko tę tabelę.
+    """
+
+    def __init__(self,
+                 data_startu: str = '2024-01',
+                 ile_wplat: int = MAX_WPLAT,
+                 wysokosc_wplat: int = 1000,
+                 inflacja: list[float] | None = None,
+                 bank: str = PEKAO.name,
+                 wiersze_na_strone: int = 12,
+                 opoznienie: float = 0.3) -> None:
+        """
+        Args:
+            data_startu (str): miesiąc pierwszej wpłaty
+            ile_wplat (int): liczba miesięcznych wpłat
+            wysokosc_wplat (int): wysokość miesięcznej wpłaty
+            inflacja (list[float] | None): inflacja [%] w kolejnych latach
+            bank (str): nazwa banku z BANKI
+            wiersze_na_strone (int): liczba widocznych wierszy miesięcznych
+            opoznienie (float): czas [s] grupowania zmian suwaków, 0 oznacza
+                przeliczenie od razu
+        """
+        inflacja = list(inflacja or [2.5] * MAX_LAT)
+        inflacja += inflacja[-1:] * (MAX_LAT - len(inflacja))
+        self.wiersze_na_strone = wiersze_na_strone
+        self.opoznienie = opoznienie
+        self.sesja = None
+        self._zmienione_lata = set()
+        self._wszystko_zmienione = False
+        self._zaplanowane = None
+
+        self.data_startu = widgets.SelectionSlider(
+            options=MIESIACE_STARTU, value=data_startu,
+            description='Start', continuous_update=False)
+        self.ile_wplat = widgets.IntSlider(
+            value=ile_wplat, min=MIN_WPLAT, max=MAX_WPLAT,
+            description='Ile wpłat', continuous_update=False)
+        self.wysokosc_wplat = widgets.IntSlider(
+            value=wysokosc_wplat, min=MIN_WYSOKOSC_WPLAT,
+            max=MAX_WYSOKOSC_WPLAT, step=50, description='Wpłata [zł]',
+            continuous_update=False)
+        self.bank = widgets.Dropdown(
+            options=list(BANKI), value=bank, description='Bank')
+        self.inflacja = [
+            widgets.FloatSlider(
+                value=pct, min=-2.0, max=20.0, step=0.1,
+                readout_format='.1f', continuous_update=False)
+            for pct in inflacja[:MAX_LAT]]
+        self.strona = widgets.IntSlider(
+            value=1, min=1, max=ile_wplat, step=wiersze_na_strone,
+            description='Od wpłaty')
+        self.podsumowanie = widgets.HTML()
+        self.tabela_roczna = widgets.HTML()
+        self.wykres = widgets.Output()
+        self.tabela_miesieczna = widgets.HTML()
+
+        for suwak in [self.data_startu, self.ile_wplat, self.wysokosc_wplat,
+                      self.bank]:
+            suwak.observe(self._na_zmiane_konta, names='value')
+        for rok, suwak in enumerate(self.inflacja):
+            suwak.observe(
+                lambda _, rok=rok: self._na_zmiane_inflacji(rok),
+                names='value')
+        self.strona.observe(lambda _: self._pokaz_strone(), names='value')
+
+        self.widget = widgets.VBox([
+            widgets.HBox([
+                widgets.VBox([self.data_startu, self.ile_wplat,
+                              self.wysokosc_wplat, self.bank]),
+                widgets.VBox(self.inflacja),
+            ]),
+            self.podsumowanie,
+            self.wykres,
+            self.tabela_roczna,
+            self.strona,
+            self.tabela_miesieczna,
+        ])
+        self._na_zmiane_konta(None)
+
+    def _ipython_display_(self) -> None:
+        display(self.widget)
+
+    def zalozenia(self) -> pd.DataFrame:
+        rok_startu = self.data_startu.value[:4]
+        return zalozenia_inflacji_i_wzrostu_m2(
+            data_startu=rok_startu,
+            inflacja=[suwak.value / 100 for suwak in self.inflacja],
+            wzrost_m2=None)
+
+    def _na_zmiane_konta(self, _) -> None:
+        self._wszystko_zmienione = True
+        self._zaplanuj()
+
+    def _na_zmiane_inflacji(self, rok: int) -> None:
+        self._zmienione_lata.add(rok)
+        self._zaplanuj()
+
+    def _zaplanuj(self) -> None:
+        if self.opoznienie <= 0:
+            self._przelicz()
+            return
+        if self._zaplanowane:
+            self._zaplanowane.cancel()
+        self._zaplanowane = asyncio.get_event_loop().call_later(
+            self.opoznienie, self._przelicz)
+
+    def _przelicz(self) -> None:
+        self._zaplanowane = None
+        rok_startu = int(self.data_startu.value[:4])
+        for rok, suwak in enumerate(self.inflacja):
+            suwak.description = f"Inflacja {rok_startu + rok} [%]"
+        if self._wszystko_zmienione or self.sesja is None:
+            self.sesja = SesjaSymulacji(
+                data_startu=self.data_startu.value,
+                ile_wplat=self.ile_wplat.value,
+                wysokosc_wplat=self.wysokosc_wplat.value,
+                zalozenia=self.zalozenia(),
+                lokata=BANKI[self.bank.value])
+        else:
+            for rok in sorted(self._zmienione_lata):
+                self.sesja.zmien_inflacje(
+                    rok=rok_startu + rok,
+                    inflacja=self.inflacja[rok].value / 100)
+        self._wszystko_zmienione = False
+        self._zmienione_lata.clear()
+        self._odswiez()
+
+    def _odswiez(self) -> None:
+        self.podsumowanie.value = (
+            f"<h3>Wartość końcowa: {self.sesja.wartosc_koncowa():,.2f} zł "
+            f"(bank {self.bank.value})</h3>")
+        self.tabela_roczna.value = aplikuj_style(
+            self.sesja.zestawienie_roczne()).to_html()
+        with self.wykres:
+            self.wykres.clear_output(wait=True)
+            rysuj_wykres_lokaty(self.sesja.konto())
+        self.strona.max = self.ile_wplat.value
+        self._pokaz_strone()
+
+    def _pokaz_strone(self) -> None:
+        if self.sesja is None:
+            # pierwsza sesja jeszcze czeka na przeliczenie, które pokaże
+            # bieżącą stronę
+            return
+        df_okno = self.sesja.konto(od=self.strona.value - 1,
+                                   ile=self.wiersze_na_strone)
+        self.tabela_miesieczna.value = aplikuj_style(df_okno).to_html()
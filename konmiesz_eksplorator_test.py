@@ -0,0 +1,104 @@
+import asyncio
+import re
+import unittest
+from unittest import mock
+from konmiesz import *
+from konmiesz_eksplorator import *
+
+
+class TestKonMieszEksplorator(unittest.TestCase):
+
+    def setUp(self):
+        self.eksplorator = EksploratorSymulacji(
+            data_startu='2024-01', ile_wplat=120, wysokosc_wplat=1000,
+            inflacja=[7.6, 4.3] + [2.5] * 9, bank='Pekao',
+            wiersze_na_strone=12, opoznienie=0)
+
+    def symulacja(self, inflacja, lokata):
+        _, _, df_konto, _ = symulacja_konta(
+            data_startu='2024-01', ile_wplat=120, wysokosc_wplat=1000,
+            zalozenia=zalozenia_inflacji_i_wzrostu_m2(
+                data_startu='2024', inflacja=[pct / 100 for pct in inflacja],
+                wzrost_m2=None),
+            lokata=lokata)
+        return df_konto
+
+    def test_zmiana_inflacji_zgodna_z_symulacja_konta(self):
+        self.eksplorator.inflacja[3].value = 5.0
+
+        df_konto = self.symulacja([7.6, 4.3, 2.5, 5.0] + [2.5] * 7, PEKAO)
+        self.assertAlmostEqual(self.eksplorator.sesja.wartosc_koncowa(),
+                               df_konto[KOL_TOTAL_TOTAL].iloc[-1])
+
+    def test_zmiana_banku_zgodna_z_symulacja_konta(self):
+        self.eksplorator.bank.value = 'Alior'
+
+        df_konto = self.symulacja([7.6, 4.3] + [2.5] * 9, ALIOR)
+        self.assertAlmostEqual(self.eksplorator.sesja.wartosc_koncowa(),
+                               df_konto[KOL_TOTAL_TOTAL].iloc[-1])
+
+    def test_zmiany_w_czasie_opoznienia_przeliczane_raz(self):
+        petla = asyncio.new_event_loop()
+        asyncio.set_event_loop(petla)
+        self.addCleanup(asyncio.set_event_loop, None)
+        self.addCleanup(petla.close)
+        eksplorator = EksploratorSymulacji(
+            data_startu='2024-01', ile_wplat=120, wysokosc_wplat=1000,
+            inflacja=[7.6, 4.3] + [2.5] * 9, bank='Pekao', opoznienie=0.05)
+        self.assertIsNone(eksplorator.sesja)
+        petla.run_until_complete(asyncio.sleep(0.1))
+        sesja = eksplorator.sesja
+
+        with mock.patch('konmiesz_eksplorator.SesjaSymulacji',
+                        wraps=SesjaSymulacji) as nowa_sesja, \
+                mock.patch.object(eksplorator, '_przelicz',
+                                  wraps=eksplorator._przelicz) as przelicz:
+            eksplorator.inflacja[3].value = 5.0
+            eksplorator.inflacja[5].value = 6.0
+            eksplorator.bank.value = 'Alior'
+            self.assertIs(eksplorator.sesja, sesja)
+            petla.run_until_complete(asyncio.sleep(0.1))
+
+        przelicz.assert_called_once()
+        nowa_sesja.assert_called_once()
+        df_konto = self.symulacja([7.6, 4.3, 2.5, 5.0, 2.5, 6.0] + [2.5] * 5,
+                                  ALIOR)
+        self.assertAlmostEqual(eksplorator.sesja.wartosc_koncowa(),
+                               df_konto[KOL_TOTAL_TOTAL].iloc[-1])
+
+    def test_przewijanie_przed_pierwszym_przeliczeniem(self):
+        petla = asyncio.new_event_loop()
+        asyncio.set_event_loop(petla)
+        self.addCleanup(asyncio.set_event_loop, None)
+        self.addCleanup(petla.close)
+        eksplorator = EksploratorSymulacji(
+            data_startu='2024-01', ile_wplat=120, wysokosc_wplat=1000,
+            inflacja=[7.6, 4.3] + [2.5] * 9, bank='Pekao', opoznienie=0.05)
+
+        eksplorator.strona.value = 25
+        petla.run_until_complete(asyncio.sleep(0.1))
+
+        oczekiwane = aplikuj_style(eksplorator.sesja.konto().iloc[24:36])
+        self.assertEqual(
+            re.sub(r'T_\w+', 'T_', eksplorator.tabela_miesieczna.value),
+            re.sub(r'T_\w+', 'T_', oczekiwane.to_html()))
+
+    def test_tabela_miesieczna_tylko_widoczne_okno(self):
+        self.eksplorator.strona.value = 25
+
+        oczekiwane = aplikuj_style(self.eksplorator.sesja.konto().iloc[24:36])
+        # pomiń losowe identyfikatory tabel stylowanych
+        self.assertEqual(
+            re.sub(r'T_\w+', 'T_', self.eksplorator.tabela_miesieczna.value),
+            re.sub(r'T_\w+', 'T_', oczekiwane.to_html()))
+
+    def test_przewijanie_nie_przelicza_symulacji(self):
+        sesja = self.eksplorator.sesja
+        tabela_roczna = self.eksplorator.tabela_roczna.value
+        self.eksplorator.tabela_roczna.value = ''
+
+        self.eksplorator.strona.value = 13
+
+        self.assertIs(self.eksplorator.sesja, sesja)
+        self.assertEqual(self.eksplorator.tabela_roczna.value, '')
+        self.assertNotEqual(tabela_roczna, '')
@@ -0,0 +1,339 @@
+"""
+Magazyn wyników przeglądu scenariuszy oparty o pliki mapowane w pamięci.
+
+Budowa z katalogu przeglądu (`konmiesz_przeglad.py`):
+    python konmiesz_magazyn.py katalog_przegladu katalog_magazynu \
+        [--miesieczne]
+
+Zapytania w notebooku:
+    magazyn = MagazynWynikow('katalog_magazynu')
+    magazyn.najlepszy_bank(data_startu='2024-03', wysokosc_wplat=800)
+    magazyn.do_ramki(magazyn.filtruj(lambda r: r['premia'] > r['odsetki']))
+
+Podsumowania scenariuszy to tablica rekordów stałej szerokości
+(`podsumowania.npy`) posortowana po kluczu (bank, miesiąc startu, wysokość
+wpłaty, założenia).  Zapytania o prefiks klucza to wyszukiwanie binarne i
+wycinek tablicy bez kopiowania, pozostałe warunki to filtry wektorowe po
+porcjach.  Opcjonalne serie miesięczne (`miesieczne.npy`, float32) mają dla
+każdego scenariusza wiersz długości najdłuższego horyzontu, uzupełniony NaN.
+"""
+
+import argparse
+import itertools
+import json
+import os
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from konmiesz import BANKI, SesjaSymulacji
+from konmiesz_przeglad import (KOLUMNY_WYNIKOW, PLIK_SPECYFIKACJI,
+                               grupy_siatki, liczba_scenariuszy, plik_shardu,
+                               scenariusze_siatki, wymiary_siatki,
+                               zalozenia_specyfikacji)
+
+PLIK_PODSUMOWAN = 'podsumowania.npy'
+PLIK_MIESIECZNYCH = 'miesieczne.npy'
+PLIK_SLOWNIKOW = 'slowniki.json'
+# miesiąc startu zapisywany jako liczba miesięcy od 2000-01
+ROK_BAZOWY = 2000
+SERIE_MIESIECZNE = ('odsetki', 'premia', 'total')
+# (pole, przesunięcie bitowe, liczba bitów) w kolejności klucza
+POLA_KLUCZA = (
+    ('bank', 56, 8),
+    ('miesiac_startu', 40, 16),
+    ('wysokosc_wplat', 16, 24),
+    ('zalozenia', 0, 16),
+)
+REKORD = np.dtype([
+    ('klucz', '<u8'),
+    ('nr', '<u8'),
+    ('bank', 'u1'),
+    ('miesiac_startu', '<u2'),
+    ('wysokosc_wplat', '<u4'),
+    ('zalozenia', '<u2'),
+    ('ile_wplat', '<u2'),
+    *[(kolumna, '<f8') for kolumna in KOLUMNY_WYNIKOW.values()],
+])
+
+
+def klucz(**pola: np.ndarray) -> np.ndarray:
+    wynik = np.zeros(np.broadcast(*pola.values()).shape, dtype=np.uint64)
+    for pole, przesuniecie, bity in POLA_KLUCZA:
+        wartosc = np.asarray(pola[pole], dtype=np.uint64)
+        if (wartosc >= 1 << bity).any():
+            raise ValueError(f"{pole} nie mieści się w {bity} bitach klucza")
+        wynik |= wartosc << np.uint64(przesuniecie)
+    return wynik
+
+
+def miesiac_startu(data_startu: str | pd.Series) -> np.ndarray:
+    okres = pd.PeriodIndex(np.atleast_1d(data_startu), freq='M')
+    return np.asarray((okres.year - ROK_BAZOWY) * 12 + okres.month - 1)
+
+
+def zbuduj_magazyn(katalog_przegladu: str,
+                   katalog: str,
+                   miesieczne: bool = False,
+                   rozmiar_porcji: int = 1_000_000) -> None:
+    """
+    Buduje magazyn wyników z shardów ukończonego przeglądu.
+
+    Shardy wczytywane są kolejno do tymczasowej tablicy mapowanej w pamięci,
+    w pamięci operacyjnej trzymana jest tylko permutacja sortująca klucze.
+
+    Args:
+        katalog_przegladu (str): katalog wyników `konmiesz_przeglad.py`
+        katalog (str): katalog magazynu
+        miesieczne (bool): czy zapisać serie miesięczne scenariuszy
+        rozmiar_porcji (int): liczba rekordów kopiowanych naraz
+
+    Raises:
+        ValueError: gdy przegląd nie jest ukończony albo kolejność wierszy
+            shardów nie odpowiada kolejności siatki
+    """
+    with open(os.path.join(katalog_przegladu, PLIK_SPECYFIKACJI)) as f:
+        specyfikacja = json.load(f)
+    rozmiar_shardu = specyfikacja.pop('rozmiar_shardu')
+    nazwy_zalozen, banki, *_ = wymiary_siatki(specyfikacja)
+    ile = liczba_scenariuszy(specyfikacja)
+    ile_shardow = len(range(0, ile, rozmiar_shardu))
+    if not all(os.path.exists(plik_shardu(katalog_przegladu, nr))
+               for nr in range(ile_shardow)):
+        raise ValueError(f"Przegląd {katalog_przegladu} nie jest ukończony")
+
+    os.makedirs(katalog, exist_ok=True)
+    plik_tymczasowy = os.path.join(katalog, PLIK_PODSUMOWAN + '.tmp')
+    rekordy = np.lib.format.open_memmap(
+        plik_tymczasowy, mode='w+', dtype=REKORD, shape=(ile,))
+    od = 0
+    for nr in range(ile_shardow):
+        df = pd.read_csv(plik_shardu(katalog_przegladu, nr))
+        # serie miesięczne przypisywane są po numerze scenariusza siatki
+        oczekiwane = DataFrame(
+            scenariusze_siatki(specyfikacja, od, od + len(df)))
+        if not df[oczekiwane.columns].astype(str).equals(
+                oczekiwane.astype(str)):
+            raise ValueError(
+                f"Shard {nr} nie odpowiada kolejności scenariuszy siatki")
+        porcja = rekordy[od:od + len(df)]
+        porcja['bank'] = df['bank'].map(banki.index)
+        porcja['miesiac_startu'] = miesiac_startu(df['data_startu'])
+        porcja['wysokosc_wplat'] = df['wysokosc_wplat']
+        porcja['zalozenia'] = df['zalozenia'].map(nazwy_zalozen.index)
+        porcja['ile_wplat'] = df['ile_wplat']
+        for kolumna in KOLUMNY_WYNIKOW.values():
+            porcja[kolumna] = df[kolumna]
+        porcja['klucz'] = klucz(**{pole: porcja[pole]
+                                   for pole, _, _ in POLA_KLUCZA})
+        od += len(df)
+
+    kolejnosc = np.argsort(rekordy['klucz'], kind='stable')
+    posortowane = np.lib.format.open_memmap(
+        os.path.join(katalog, PLIK_PODSUMOWAN), mode='w+', dtype=REKORD,
+        shape=(ile,))
+    for od in range(0, ile, rozmiar_porcji):
+        posortowane[od:od + rozmiar_porcji] = \
+            rekordy[kolejnosc[od:od + rozmiar_porcji]]
+    posortowane['nr'] = np.arange(ile, dtype=np.uint64)
+    posortowane.flush()
+    del rekordy
+    os.remove(plik_tymczasowy)
+
+    if miesieczne:
+        pozycje = np.empty(ile, dtype=np.int64)
+        pozycje[kolejnosc] = np.arange(ile)
+        zapisz_serie_miesieczne(
+            specyfikacja=specyfikacja, pozycje=pozycje,
+            plik=os.path.join(katalog, PLIK_MIESIECZNYCH))
+
+    with open(os.path.join(katalog, PLIK_SLOWNIKOW), 'w') as f:
+        json.dump({'banki': banki, 'zalozenia': nazwy_zalozen}, f, indent=2)
+
+
+def zapisz_serie_miesieczne(specyfikacja: dict,
+                            pozycje: np.ndarray,
+                            plik: str) -> None:
+    """
+    Zapisuje serie miesięczne SERIE_MIESIECZNE w kolejności magazynu.
+
+    Scenariusze różniące się tylko wysokością wpłaty leżą w siatce obok
+    siebie (`grupy_siatki`), a kwoty są liniowe względem wpłaty, więc każda
+    grupa liczona jest jedną symulacją dla wpłat po 1 zł.
+
+    Args:
+        specyfikacja (dict): specyfikacja siatki
+        pozycje (np.ndarray): pozycja scenariusza siatki w magazynie
+        plik (str): plik serii miesięcznych
+    """
+    zalozenia = zalozenia_specyfikacji(specyfikacja)
+    wysokosci_wplat = np.array(specyfikacja['wysokosci_wplat'], dtype=float)
+    serie = np.lib.format.open_memmap(
+        plik, mode='w+', dtype=np.float32,
+        shape=(len(pozycje), max(specyfikacja['ile_wplat']),
+               len(SERIE_MIESIECZNE)))
+    for od, (nazwa, bank, data_startu, ile_wplat) in zip(
+            itertools.count(0, len(wysokosci_wplat)),
+            grupy_siatki(specyfikacja)):
+        sesja = SesjaSymulacji(
+            data_startu=data_startu, ile_wplat=ile_wplat, wysokosc_wplat=1,
+            zalozenia=zalozenia[nazwa], lokata=BANKI[bank])
+        df_konto = sesja.konto().droplevel(0, axis=1)
+        jednostkowe = np.column_stack([
+            df_konto[kolumna]
+            for kolumna in KOLUMNY_WYNIKOW
+            if KOLUMNY_WYNIKOW[kolumna] in SERIE_MIESIECZNE])
+        wiersze = np.full(serie.shape[1:], np.nan, dtype=np.float32)
+        for pozycja, wysokosc_wplat in zip(
+                pozycje[od:od + len(wysokosci_wplat)], wysokosci_wplat):
+            wiersze[:ile_wplat] = jednostkowe * wysokosc_wplat
+            serie[pozycja] = wiersze
+    serie.flush()
+
+
+class MagazynWynikow:
+    """
+    Zapytania o wyniki przeglądu bez wczytywania całego magazynu.
+    """
+
+    def __init__(self, katalog: str) -> None:
+        self.rekordy = np.load(os.path.join(katalog, PLIK_PODSUMOWAN),
+                               mmap_mode='r')
+        plik_miesiecznych = os.path.join(katalog, PLIK_MIESIECZNYCH)
+        self.miesieczne = np.load(plik_miesiecznych, mmap_mode='r') \
+            if os.path.exists(plik_miesiecznych) else None
+        with open(os.path.join(katalog, PLIK_SLOWNIKOW)) as f:
+            slowniki = json.load(f)
+        self.banki = slowniki['banki']
+        self.zalozenia = slowniki['zalozenia']
+
+    def __len__(self) -> int:
+        return len(self.rekordy)
+
+    def wybierz(self,
+                bank: str | None = None,
+                data_startu: str | None = None,
+                wysokosc_wplat: int | None = None,
+                zalozenia: str | None = None,
+                ile_wplat: int | None = None) -> np.ndarray:
+        """
+        Wybiera scenariusze o podanych wartościach pól.
+
+        Pola podane od początku klucza (bank, miesiąc startu, wysokość
+        wpłaty, założenia) zawężają wynik wyszukiwaniem binarnym do wycinka
+        magazynu bez kopiowania, pozostałe są filtrowane wektorowo.
+
+        Returns:
+            np.ndarray: rekordy REKORD wybranych scenariuszy
+        """
+        pola = {
+            'bank': None if bank is None else self.banki.index(bank),
+            'miesiac_startu': None if data_startu is None else
+            miesiac_startu(data_startu)[0],
+            'wysokosc_wplat': wysokosc_wplat,
+            'zalozenia': None if zalozenia is None else
+            self.zalozenia.index(zalozenia),
+        }
+        od, przesuniecie = 0, 64
+        for pole, przesuniecie_pola, _ in POLA_KLUCZA:
+            if pola[pole] is None:
+                break
+            od |= int(pola.pop(pole)) << przesuniecie_pola
+            przesuniecie = przesuniecie_pola
+        wybrane = self.rekordy
+        if przesuniecie < 64:
+            klucze = self.rekordy['klucz']
+            poczatek = np.searchsorted(klucze, np.uint64(od), side='left')
+            do = od + (1 << przesuniecie)
+            koniec = len(klucze) if do >= 1 << 64 else np.searchsorted(
+                klucze, np.uint64(do), side='left')
+            wybrane = self.rekordy[poczatek:koniec]
+
+        pola['ile_wplat'] = ile_wplat
+        warunki = {pole: wartosc for pole, wartosc in pola.items()
+                   if wartosc is not None}
+        if warunki:
+            maska = np.ones(len(wybrane), dtype=bool)
+            for pole, wartosc in warunki.items():
+                maska &= wybrane[pole] == wartosc
+            wybrane = wybrane[maska]
+        return wybrane
+
+    def filtruj(self,
+                warunek: Callable[[np.ndarray], np.ndarray],
+                rekordy: np.ndarray | None = None,
+                rozmiar_porcji: int = 1_000_000) -> np.ndarray:
+        """
+        Wybiera rekordy spełniające wektorowy warunek, liczony po porcjach.
+
+        Args:
+            warunek (Callable[[np.ndarray], np.ndarray]): maska dla porcji
+                rekordów, np. lambda r: r['premia'] > r['odsetki']
+            rekordy (np.ndarray | None): przeszukiwane rekordy, domyślnie
+                cały magazyn
+            rozmiar_porcji (int): liczba rekordów sprawdzanych naraz
+
+        Returns:
+            np.ndarray: rekordy REKORD spełniające warunek
+        """
+        rekordy = self.rekordy if rekordy is None else rekordy
+        wybrane = [porcja[warunek(porcja)]
+                   for porcja in (rekordy[od:od + rozmiar_porcji]
+                                  for od in range(0, len(rekordy),
+                                                  rozmiar_porcji))]
+        return np.concatenate(wybrane) if wybrane else rekordy[:0]
+
+    def najlepszy_bank(self,
+                       data_startu: str,
+                       wysokosc_wplat: int,
+                       zalozenia: str | None = None,
+                       ile_wplat: int | None = None) -> DataFrame:
+        """
+        Zwraca scenariusze banków posortowane malejąco po wartości końcowej.
+        """
+        rekordy = np.concatenate([
+            self.wybierz(bank=bank, data_startu=data_startu,
+                         wysokosc_wplat=wysokosc_wplat, zalozenia=zalozenia,
+                         ile_wplat=ile_wplat)
+            for bank in self.banki])
+        return self.do_ramki(rekordy[np.argsort(-rekordy['total'],
+                                                kind='stable')])
+
+    def serie_miesieczne(self, rekordy: np.ndarray) -> np.ndarray:
+        """
+        Zwraca serie miesięczne (scenariusz, miesiąc, SERIE_MIESIECZNE).
+        """
+        if self.miesieczne is None:
+            raise ValueError("Magazyn zbudowano bez serii miesięcznych")
+        return self.miesieczne[rekordy['nr'].astype(np.int64)]
+
+    def do_ramki(self, rekordy: np.ndarray) -> DataFrame:
+        miesiace = rekordy['miesiac_startu'].astype(int)
+        return DataFrame(data={
+            'zalozenia': np.array(self.zalozenia)[rekordy['zalozenia']],
+            'bank': np.array(self.banki)[rekordy['bank']],
+            'data_startu': [f"{ROK_BAZOWY + m // 12}-{m % 12 + 1:02d}"
+                            for m in miesiace],
+            'ile_wplat': rekordy['ile_wplat'].astype(int),
+            'wysokosc_wplat': rekordy['wysokosc_wplat'].astype(int),
+            **{kolumna: rekordy[kolumna]
+               for kolumna in KOLUMNY_WYNIKOW.values()},
+        }, index=pd.Index(rekordy['nr'].astype(np.int64), name='nr'))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Budowa magazynu wyników przeglądu scenariuszy")
+    parser.add_argument('przeglad', help="katalog wyników przeglądu")
+    parser.add_argument('katalog', help="katalog magazynu")
+    parser.add_argument('--miesieczne', action='store_true',
+                        help="zapisz też serie miesięczne scenariuszy")
+    args = parser.parse_args(argv)
+    zbuduj_magazyn(katalog_przegladu=args.przeglad, katalog=args.katalog,
+                   miesieczne=args.miesieczne)
+
+
+if __name__ == '__main__':
+    main()
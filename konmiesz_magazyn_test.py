@@ -0,0 +1,93 @@
+import shutil
+import tempfile
+import unittest
+from konmiesz import *
+from konmiesz_magazyn import *
+from konmiesz_przeglad import przeglad
+from konmiesz_przeglad_test import SPECYFIKACJA
+
+
+class TestKonMieszMagazyn(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.katalog = tempfile.TemporaryDirectory()
+        katalog_przegladu = os.path.join(cls.katalog.name, 'przeglad')
+        cls.katalog_przegladu = katalog_przegladu
+        katalog_magazynu = os.path.join(cls.katalog.name, 'magazyn')
+        cls.wyniki = pd.read_csv(przeglad(
+            specyfikacja=SPECYFIKACJA, katalog=katalog_przegladu, procesy=1,
+            rozmiar_shardu=5))
+        zbuduj_magazyn(katalog_przegladu=katalog_przegladu,
+                       katalog=katalog_magazynu, miesieczne=True)
+        cls.magazyn = MagazynWynikow(katalog_magazynu)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.katalog.cleanup()
+
+    def test_wybierz_prefiks_klucza_bez_kopiowania(self):
+        testowane = self.magazyn.wybierz(bank='Alior', data_startu='2024-01')
+
+        self.assertTrue(np.shares_memory(testowane, self.magazyn.rekordy))
+        oczekiwane = self.wyniki[(self.wyniki.bank == 'Alior') &
+                                 (self.wyniki.data_startu == '2024-01')]
+        self.assertEqual(len(testowane), len(oczekiwane))
+        self.assertEqual(sorted(testowane['total']),
+                         sorted(oczekiwane['total']))
+
+    def test_wybierz_poza_prefiksem_klucza(self):
+        testowane = self.magazyn.wybierz(wysokosc_wplat=500, ile_wplat=36)
+
+        oczekiwane = self.wyniki[(self.wyniki.wysokosc_wplat == 500) &
+                                 (self.wyniki.ile_wplat == 36)]
+        self.assertEqual(sorted(testowane['total']),
+                         sorted(oczekiwane['total']))
+
+    def test_filtruj(self):
+        testowane = self.magazyn.filtruj(
+            lambda r: r['premia'] > r['odsetki'], rozmiar_porcji=7)
+
+        oczekiwane = self.wyniki[self.wyniki.premia > self.wyniki.odsetki]
+        self.assertEqual(sorted(testowane['total']),
+                         sorted(oczekiwane['total']))
+
+    def test_najlepszy_bank(self):
+        testowane = self.magazyn.najlepszy_bank(
+            data_startu='2023-12', wysokosc_wplat=1000, ile_wplat=24)
+
+        oczekiwane = self.wyniki[(self.wyniki.data_startu == '2023-12') &
+                                 (self.wyniki.wysokosc_wplat == 1000) &
+                                 (self.wyniki.ile_wplat == 24)]
+        oczekiwane = oczekiwane.sort_values('total', ascending=False)
+        self.assertEqual(list(testowane.bank), list(oczekiwane.bank))
+        np.testing.assert_allclose(testowane.total, oczekiwane.total)
+
+    def test_serie_miesieczne(self):
+        rekordy = self.magazyn.wybierz(
+            bank='Pekao', data_startu='2023-11', wysokosc_wplat=500,
+            zalozenia='bazowe', ile_wplat=24)
+
+        testowane = self.magazyn.serie_miesieczne(rekordy)
+
+        _, _, df_konto, _ = symulacja_konta(
+            data_startu='2023-11', ile_wplat=24, wysokosc_wplat=500,
+            zalozenia=zalozenia_specyfikacji(SPECYFIKACJA)['bazowe'],
+            lokata=PEKAO)
+        self.assertEqual(testowane.shape, (1, 36, len(SERIE_MIESIECZNE)))
+        np.testing.assert_allclose(
+            testowane[0, :24, SERIE_MIESIECZNE.index('total')],
+            df_konto[KOL_TOTAL_TOTAL], rtol=1e-6)
+        self.assertTrue(np.isnan(testowane[0, 24:]).all())
+
+    def test_zbuduj_magazyn_kolejnosc_shardu_niezgodna_z_siatka(self):
+        katalog_przegladu = os.path.join(self.katalog.name, 'przestawiony')
+        shutil.copytree(self.katalog_przegladu, katalog_przegladu)
+        plik = plik_shardu(katalog_przegladu, 1)
+        pd.read_csv(plik).iloc[::-1].to_csv(plik, index=False)
+
+        with self.assertRaises(ValueError):
+            zbuduj_magazyn(
+                katalog_przegladu=katalog_przegladu,
+                katalog=os.path.join(self.katalog.name, 'magazyn2'),
+                miesieczne=True)
@@ -0,0 +1,314 @@
+"""
+Przegląd (sweep) siatki scenariuszy konta mieszkaniowego.
+
+Uruchomienie:
+    python konmiesz_przeglad.py specyfikacja.json katalog_wynikow
+
+Specyfikacja siatki (JSON):
+    {
+        "daty_startu": {"od": "2024-01", "do": "2024-12"},
+        "ile_wplat": [36, 60],
+        "wysokosci_wplat": [500, 800, 1000],
+        "banki": ["Pekao", "Alior"],
+        "zalozenia": {
+            "bazowe": {"data_startu": "2024",
+                       "inflacja": [0.06, 0.05, 0.04, 0.04, 0.04, 0.04],
+                       "wzrost_m2": null}
+        }
+    }
+
+Siatka jest dzielona na shardy (zakresy numerów scenariuszy) liczone w puli
+procesów.  Każdy ukończony shard zapisywany jest do osobnego pliku CSV
+w katalogu wyników, więc przerwany przegląd uruchomiony ponownie liczy tylko
+brakujące shardy.  Na koniec wszystkie shardy są łączone strumieniowo
+w `wyniki.csv`.
+"""
+
+import argparse
+import itertools
+import json
+import math
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, NamedTuple
+
+import pandas as pd
+from pandas import DataFrame
+
+from konmiesz import (BANKI, ODSETKI_BANKU_TOTAL, PREMIA_BEZ_PROWIZJI,
+                      PREMIA_TOTAL, TOTAL_Z_ODSETKAMI_I_PREMIA_BEZ_PROWIZJI,
+                      WPLATA_TOTAL, daty_wplat_konta, indeksy_lat_zalozen,
+                      symulacja_konta_wsadowa, zalozenia_inflacji_i_wzrostu_m2)
+
+PLIK_SPECYFIKACJI = 'specyfikacja.json'
+PLIK_WYNIKOW = 'wyniki.csv'
+KOLUMNY_WYNIKOW = {
+    WPLATA_TOTAL: 'suma_wplat',
+    ODSETKI_BANKU_TOTAL: 'odsetki',
+    PREMIA_TOTAL: 'premia',
+    PREMIA_BEZ_PROWIZJI: 'premia_bez_prowizji',
+    TOTAL_Z_ODSETKAMI_I_PREMIA_BEZ_PROWIZJI: 'total',
+}
+
+
+class ScenariuszSiatki(NamedTuple):
+    zalozenia: str
+    bank: str
+    data_startu: str
+    ile_wplat: int
+    wysokosc_wplat: int
+
+
+def zalozenia_specyfikacji(specyfikacja: dict) -> dict[str, DataFrame]:
+    return {
+        nazwa: zalozenia_inflacji_i_wzrostu_m2(
+            data_startu=zalozenia['data_startu'],
+            inflacja=zalozenia['inflacja'],
+            wzrost_m2=zalozenia.get('wzrost_m2'))
+        for nazwa, zalozenia in specyfikacja['zalozenia'].items()
+    }
+
+
+def daty_startu_specyfikacji(specyfikacja: dict) -> list[str]:
+    return pd.date_range(
+        start=specyfikacja['daty_startu']['od'],
+        end=specyfikacja['daty_startu']['do'],
+        freq=pd.offsets.MonthBegin()
+    ).strftime('%Y-%m').tolist()
+
+
+def wymiary_siatki(specyfikacja: dict) -> list[list]:
+    """
+    Zwraca wartości kolejnych pól ScenariuszSiatki w kolejności siatki.
+
+    Wysokości wpłat są ostatnim (najszybciej zmieniającym się) wymiarem, więc
+    scenariusze różniące się tylko wpłatą leżą obok siebie i liczone są jedną
+    symulacją wsadową.
+    """
+    return [
+        list(specyfikacja['zalozenia']),
+        list(specyfikacja['banki']),
+        daty_startu_specyfikacji(specyfikacja),
+        list(specyfikacja['ile_wplat']),
+        list(specyfikacja['wysokosci_wplat']),
+    ]
+
+
+def liczba_scenariuszy(specyfikacja: dict) -> int:
+    return math.prod(len(wymiar) for wymiar in wymiary_siatki(specyfikacja))
+
+
+def grupy_siatki(specyfikacja: dict) -> Iterator[tuple]:
+    """
+    Scenariusze siatki bez wysokości wpłat, w kolejności siatki.
+
+    Grupa nr `i` to scenariusze od `i * len(wysokosci_wplat)` włącznie do
+    `(i + 1) * len(wysokosci_wplat)` wyłącznie.
+
+    Returns:
+        Iterator[tuple]: (założenia, bank, data startu, liczba wpłat)
+    """
+    return itertools.product(*wymiary_siatki(specyfikacja)[:-1])
+
+
+def scenariusze_siatki(specyfikacja: dict,
+                       od: int = 0,
+                       do: int | None = None) -> Iterator[ScenariuszSiatki]:
+    """
+    Scenariusze siatki o numerach od `od` do `do` (wyłącznie).
+
+    Scenariusze wyliczane są z numerów, bez rozwijania wcześniejszej części
+    siatki, więc shard można wyznaczyć niezależnie od pozostałych.
+
+    Args:
+        specyfikacja (dict): specyfikacja siatki
+        od (int): numer pierwszego scenariusza
+        do (int | None): numer za ostatnim scenariuszem, domyślnie do końca
+
+    Returns:
+        Iterator[ScenariuszSiatki]: scenariusze w kolejności siatki
+    """
+    wymiary = wymiary_siatki(specyfikacja)
+    do = math.prod(len(wymiar) for wymiar in wymiary) if do is None else do
+    for nr in range(od, do):
+        pola = []
+        for wymiar in reversed(wymiary):
+            nr, indeks = divmod(nr, len(wymiar))
+            pola.append(wymiar[indeks])
+        yield ScenariuszSiatki(*reversed(pola))
+
+
+def sprawdz_specyfikacje(specyfikacja: dict) -> None:
+    """
+    Sprawdza, czy wszystkie scenariusze siatki dają się policzyć.
+
+    Args:
+        specyfikacja (dict): specyfikacja siatki
+
+    Raises:
+        KeyError: gdy bank nie występuje w BANKI albo założenia nie obejmują
+            lat któregoś ze scenariuszy
+    """
+    for bank in specyfikacja['banki']:
+        if bank not in BANKI:
+            raise KeyError(f"Nieznany bank '{bank}', dostępne: {list(BANKI)}")
+    daty_startu = daty_startu_specyfikacji(specyfikacja)
+    for nazwa, zalozenia in zalozenia_specyfikacji(specyfikacja).items():
+        for data_startu, ile_wplat in itertools.product(
+                [daty_startu[0], daty_startu[-1]],
+                [min(specyfikacja['ile_wplat']),
+                 max(specyfikacja['ile_wplat'])]):
+            try:
+                indeksy_lat_zalozen(
+                    daty_wplat_konta(data_startu=data_startu,
+                                     ile_wplat=ile_wplat), zalozenia)
+            except KeyError as e:
+                raise KeyError(f"Założenia '{nazwa}': {e.args[0]}") from e
+
+
+def licz_shard(specyfikacja: dict, od: int, do: int) -> DataFrame:
+    """
+    Liczy podsumowania scenariuszy jednego shardu.
+
+    Args:
+        specyfikacja (dict): specyfikacja siatki
+        od (int): numer pierwszego scenariusza shardu
+        do (int): numer za ostatnim scenariuszem shardu
+
+    Returns:
+        DataFrame: kolumny ScenariuszSiatki i KOLUMNY_WYNIKOW
+    """
+    zalozenia = zalozenia_specyfikacji(specyfikacja)
+    wyniki = []
+    for (nazwa, bank, data_startu, ile_wplat), grupa in itertools.groupby(
+            scenariusze_siatki(specyfikacja, od, do), key=lambda s: s[:4]):
+        wysokosci_wplat = [s.wysokosc_wplat for s in grupa]
+        df = symulacja_konta_wsadowa(
+            data_startu=data_startu, ile_wplat=ile_wplat,
+            wysokosci_wplat=wysokosci_wplat, zalozenia=zalozenia[nazwa],
+            lokata=BANKI[bank])
+        wyniki.append(DataFrame(data={
+            'zalozenia': nazwa,
+            'bank': bank,
+            'data_startu': data_startu,
+            'ile_wplat': ile_wplat,
+            'wysokosc_wplat': wysokosci_wplat,
+            **{nowa: df[kolumna].to_numpy()
+               for kolumna, nowa in KOLUMNY_WYNIKOW.items()}
+        }))
+    return pd.concat(wyniki, ignore_index=True)
+
+
+def plik_shardu(katalog: str, nr: int) -> str:
+    return os.path.join(katalog, f'shard_{nr:06d}.csv')
+
+
+def polacz_shardy(katalog: str, ile_shardow: int) -> str:
+    """
+    Łączy pliki shardów w `wyniki.csv`, kopiując je strumieniowo.
+
+    Returns:
+        str: ścieżka pliku wyników
+    """
+    plik_wynikow = os.path.join(katalog, PLIK_WYNIKOW)
+    with open(plik_wynikow + '.tmp', 'w') as wyniki:
+        for nr in range(ile_shardow):
+            with open(plik_shardu(katalog, nr)) as shard:
+                naglowek = shard.readline()
+                if nr == 0:
+                    wyniki.write(naglowek)
+                shutil.copyfileobj(shard, wyniki)
+    os.replace(plik_wynikow + '.tmp', plik_wynikow)
+    return plik_wynikow
+
+
+def przeglad(specyfikacja: dict,
+             katalog: str,
+             procesy: int | None = None,
+             rozmiar_shardu: int = 2000) -> str:
+    """
+    Liczy siatkę scenariuszy, wznawiając od ostatniego punktu kontrolnego.
+
+    Ani scenariusze, ani wyniki całej siatki nie są trzymane w pamięci:
+    procesy dostają zakresy numerów scenariuszy, a wyniki shardów są łączone
+    strumieniowo w pliku `wyniki.csv`.
+
+    Args:
+        specyfikacja (dict): specyfikacja siatki
+        katalog (str): katalog wyników i punktów kontrolnych
+        procesy (int | None): liczba procesów, domyślnie liczba rdzeni
+        rozmiar_shardu (int): liczba scenariuszy w jednym shardzie
+
+    Raises:
+        KeyError: gdy bank nie występuje w BANKI albo założenia nie obejmują
+            lat któregoś ze scenariuszy
+        ValueError: gdy katalog zawiera przegląd innej specyfikacji
+
+    Returns:
+        str: ścieżka pliku `wyniki.csv` z wynikami wszystkich scenariuszy
+    """
+    sprawdz_specyfikacje(specyfikacja)
+    os.makedirs(katalog, exist_ok=True)
+    plik_specyfikacji = os.path.join(katalog, PLIK_SPECYFIKACJI)
+    if os.path.exists(plik_specyfikacji):
+        with open(plik_specyfikacji) as f:
+            if json.load(f) != {**specyfikacja,
+                                'rozmiar_shardu': rozmiar_shardu}:
+                raise ValueError(
+                    f"{katalog} zawiera przegląd innej specyfikacji")
+    else:
+        with open(plik_specyfikacji, 'w') as f:
+            json.dump({**specyfikacja, 'rozmiar_shardu': rozmiar_shardu}, f,
+                      indent=2)
+
+    ile = liczba_scenariuszy(specyfikacja)
+    ile_shardow = len(range(0, ile, rozmiar_shardu))
+    shardy = {nr: (nr * rozmiar_shardu, min((nr + 1) * rozmiar_shardu, ile))
+              for nr in range(ile_shardow)
+              if not os.path.exists(plik_shardu(katalog, nr))}
+    zrobione = ile - sum(do - od for od, do in shardy.values())
+    policzone = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=procesy or os.cpu_count()) as pula:
+        zadania = {pula.submit(licz_shard, specyfikacja, od, do): nr
+                   for nr, (od, do) in shardy.items()}
+        for zadanie in as_completed(zadania):
+            nr = zadania[zadanie]
+            plik = plik_shardu(katalog, nr)
+            # zapis atomowy: shard istnieje tylko, jeśli jest kompletny
+            zadanie.result().to_csv(plik + '.tmp', index=False)
+            os.replace(plik + '.tmp', plik)
+            od, do = shardy[nr]
+            policzone += do - od
+            tempo = policzone / (time.perf_counter() - start)
+            print(f"\r{zrobione + policzone:,}/{ile:,} "
+                  f"scenariuszy, {tempo:,.0f} scenariuszy/s",
+                  end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+
+    return polacz_shardy(katalog=katalog, ile_shardow=ile_shardow)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Przegląd siatki scenariuszy konta mieszkaniowego")
+    parser.add_argument('specyfikacja',
+                        help="plik JSON ze specyfikacją siatki")
+    parser.add_argument('katalog',
+                        help="katalog wyników i punktów kontrolnych")
+    parser.add_argument('--procesy', type=int, default=None,
+                        help="liczba procesów (domyślnie liczba rdzeni)")
+    parser.add_argument('--rozmiar-shardu', type=int, default=2000,
+                        help="liczba scenariuszy w jednym shardzie")
+    args = parser.parse_args(argv)
+    with open(args.specyfikacja) as f:
+        specyfikacja = json.load(f)
+    przeglad(specyfikacja=specyfikacja, katalog=args.katalog,
+             procesy=args.procesy, rozmiar_shardu=args.rozmiar_shardu)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+import itertools
+import os
+import tempfile
+import unittest
+from konmiesz import *
+from konmiesz_przeglad import *
+
+
+SPECYFIKACJA = {
+    'daty_startu': {'od': '2023-11', 'do': '2024-02'},
+    'ile_wplat': [24, 36],
+    'wysokosci_wplat': [500, 1000],
+    'banki': ['Pekao', 'Alior'],
+    'zalozenia': {
+        'bazowe': {'data_startu': '2023',
+                   'inflacja': [0.12, 0.06, 0.05, 0.04, 0.04],
+                   'wzrost_m2': None},
+    },
+}
+
+
+class TestKonMieszPrzeglad(unittest.TestCase):
+
+    def test_sprawdz_specyfikacje_bez_zalozen_dla_lat(self):
+        specyfikacja = {**SPECYFIKACJA, 'ile_wplat': [24, 60]}
+
+        with self.assertRaises(KeyError):
+            sprawdz_specyfikacje(specyfikacja)
+
+    def test_sprawdz_specyfikacje_nieznany_bank(self):
+        specyfikacja = {**SPECYFIKACJA, 'banki': ['Pekao', 'PKO']}
+
+        with self.assertRaises(KeyError):
+            sprawdz_specyfikacje(specyfikacja)
+
+    def test_scenariusze_siatki_z_numerow(self):
+        siatka = [ScenariuszSiatki(*scenariusz) for scenariusz in
+                  itertools.product(*wymiary_siatki(SPECYFIKACJA))]
+
+        self.assertEqual(liczba_scenariuszy(SPECYFIKACJA), len(siatka))
+        self.assertEqual(list(scenariusze_siatki(SPECYFIKACJA)), siatka)
+        self.assertEqual(list(scenariusze_siatki(SPECYFIKACJA, 7, 13)),
+                         siatka[7:13])
+        self.assertEqual(
+            [grupa + (wysokosc_wplat,)
+             for grupa in grupy_siatki(SPECYFIKACJA)
+             for wysokosc_wplat in SPECYFIKACJA['wysokosci_wplat']],
+            siatka)
+
+    def test_przeglad_bledna_specyfikacja_nie_blokuje_katalogu(self):
+        with tempfile.TemporaryDirectory() as katalog:
+            with self.assertRaises(KeyError):
+                przeglad(specyfikacja={**SPECYFIKACJA, 'ile_wplat': [24, 60]},
+                         katalog=katalog, procesy=1)
+
+            self.assertFalse(
+                os.path.exists(os.path.join(katalog, PLIK_SPECYFIKACJI)))
+            wyniki = pd.read_csv(przeglad(
+                specyfikacja=SPECYFIKACJA, katalog=katalog, procesy=1))
+
+        self.assertEqual(len(wyniki), 2 * 4 * 2 * 2)
+
+    def test_przeglad_nieznany_bank_nie_blokuje_katalogu(self):
+        with tempfile.TemporaryDirectory() as katalog:
+            with self.assertRaises(KeyError):
+                przeglad(specyfikacja={**SPECYFIKACJA,
+                                       'banki': ['Pekao', 'PKO']},
+                         katalog=katalog, procesy=1, rozmiar_shardu=5)
+
+            self.assertEqual(os.listdir(katalog), [])
+            wyniki = pd.read_csv(przeglad(
+                specyfikacja=SPECYFIKACJA, katalog=katalog, procesy=1,
+                rozmiar_shardu=5))
+
+        self.assertEqual(len(wyniki), 2 * 4 * 2 * 2)
+
+    def test_przeglad_zgodny_z_symulacja_konta(self):
+        with tempfile.TemporaryDirectory() as katalog:
+            wyniki = pd.read_csv(przeglad(
+                specyfikacja=SPECYFIKACJA, katalog=katalog, procesy=2,
+                rozmiar_shardu=5))
+
+        self.assertEqual(len(wyniki), 2 * 4 * 2 * 2)
+        wiersz = wyniki[(wyniki.bank == 'Alior') &
+                        (wyniki.data_startu == '2024-01') &
+                        (wyniki.ile_wplat == 36) &
+                        (wyniki.wysokosc_wplat == 500)].iloc[0]
+        _, _, df_konto, _ = symulacja_konta(
+            data_startu='2024-01', ile_wplat=36, wysokosc_wplat=500,
+            zalozenia=zalozenia_specyfikacji(SPECYFIKACJA)['bazowe'],
+            lokata=ALIOR)
+        ostatni = df_konto.iloc[-1]
+        self.assertAlmostEqual(wiersz.suma_wplat, ostatni[KOL_WPLATA_TOTAL])
+        self.assertAlmostEqual(wiersz.premia, ostatni[KOL_PREMIA_TOTAL])
+        self.assertAlmostEqual(wiersz.total, ostatni[KOL_TOTAL_TOTAL])
+
+    def test_przeglad_wznawia_od_punktu_kontrolnego(self):
+        with tempfile.TemporaryDirectory() as katalog:
+            oczekiwane = pd.read_csv(przeglad(
+                specyfikacja=SPECYFIKACJA, katalog=katalog, procesy=1,
+                rozmiar_shardu=5))
+            os.remove(plik_shardu(katalog, 2))
+            mtime = os.path.getmtime(plik_shardu(katalog, 0))
+
+            testowane = pd.read_csv(przeglad(
+                specyfikacja=SPECYFIKACJA, katalog=katalog, procesy=1,
+                rozmiar_shardu=5))
+
+            self.assertEqual(os.path.getmtime(plik_shardu(katalog, 0)), mtime)
+            pd.testing.assert_frame_equal(testowane, oczekiwane)
+            with self.assertRaises(ValueError):
+                przeglad(specyfikacja=SPECYFIKACJA, katalog=katalog,
+                         rozmiar_shardu=7)
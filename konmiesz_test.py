@@ -277,6 +277,189 @@ class TestKonMiesz(unittest.TestCase):
         testowane = df_roczne[[KOL_WPLATA_TOTAL, KOL_PREMIA_TOTAL]]
         pd.testing.assert_frame_equal(testowane, oczekiwane)
 
+    def test_saldo_procent_zlozony_zgodne_z_licz_odsetki(self):
+        wplaty = np.array([1000.0] * 6)
+        odsetki = np.array([0.03] * 3 + [0.02] * 3)
+        index = pd.Index(range(1, 7))
+
+        oczekiwane = licz_odsetki_procent_zlozony(
+            wplaty=DataFrame(wplaty), odsetki=DataFrame(odsetki), index=index)
+
+        np.testing.assert_allclose(
+            saldo_procent_zlozony(wplaty, odsetki), oczekiwane[0].to_numpy())
+
+    def test_wrazliwosc_na_zalozenia_zgodna_z_roznicami_skonczonymi(self):
+        """
+        Porównuje pochodne analityczne z ilorazami różnicowymi symulacji.
+
+        Założenia obejmują obcięcie premii z obu stron (art. 14.4 ustawy), lata
+        z wyższym wzrostem m2 oraz oprocentowanie Pekao zależne od inflacji.
+        """
+        inflacja = [0.12, 0.05, 0.005, 0.2, 0.03, 0.07]
+        wzrost_m2 = [0.02, 0.08, 0.0, 0.1, 0.01, 0.01]
+
+        def wynik(inflacja, wzrost_m2):
+            zalozenia = zalozenia_inflacji_i_wzrostu_m2(
+                data_startu='2023', inflacja=inflacja, wzrost_m2=wzrost_m2)
+            _, _, df_konto, _ = symulacja_konta(
+                data_startu='2023-04', ile_wplat=5 * 12, wysokosc_wplat=800,
+                zalozenia=zalozenia, lokata=PEKAO)
+            return df_konto[KOL_TOTAL_TOTAL].iloc[-1]
+
+        testowane = wrazliwosc_na_zalozenia(
+            data_startu='2023-04', ile_wplat=5 * 12, wysokosc_wplat=800,
+            zalozenia=zalozenia_inflacji_i_wzrostu_m2(
+                data_startu='2023', inflacja=inflacja, wzrost_m2=wzrost_m2),
+            lokata=PEKAO)
+
+        h = 1e-6
+        bazowy = wynik(inflacja, wzrost_m2)
+        for rok in range(len(inflacja)):
+            inflacja_h = list(inflacja)
+            inflacja_h[rok] += h
+            wzrost_m2_h = list(wzrost_m2)
+            wzrost_m2_h[rok] += h
+            self.assertAlmostEqual(
+                testowane[INFLACJA].iloc[rok],
+                (wynik(inflacja_h, wzrost_m2) - bazowy) / h, delta=0.05)
+            self.assertAlmostEqual(
+                testowane[WZROST_M2].iloc[rok],
+                (wynik(inflacja, wzrost_m2_h) - bazowy) / h, delta=0.05)
+
+    def test_sesja_symulacji_po_zmianach_zgodna_z_symulacja_konta(self):
+        """
+        Sesja po zmianie inflacji, wzrostu m2 i oprocentowania daje te same
+        zestawienia co pełne przeliczenie symulacji z nowymi założeniami.
+        """
+        inflacja = [0.12, 0.05, 0.03, 0.2, 0.03, 0.07]
+        wzrost_m2 = [0.02, 0.08, 0.0, 0.1, 0.01, 0.01]
+        sesja = SesjaSymulacji(
+            data_startu='2023-04', ile_wplat=5 * 12, wysokosc_wplat=800,
+            zalozenia=zalozenia_inflacji_i_wzrostu_m2(
+                data_startu='2023', inflacja=inflacja, wzrost_m2=wzrost_m2),
+            lokata=ALIOR)
+
+        sesja.zmien_inflacje(2025, 0.005)
+        sesja.zmien_wzrost_m2('2026', 0.04)
+        sesja.zmien_oprocentowanie(wplata_nr=40, procent=Procent(4.0),
+                                   ile_wplat=6)
+
+        inflacja[2] = 0.005
+        wzrost_m2[3] = 0.04
+
+        def oprocentowanie(daty):
+            odsetki = odsetki_bankowe_alior(daty)
+            odsetki.iloc[39:45, 0] = Procent(4.0)
+            return odsetki
+
+        _, _, df_konto, df_roczne = symulacja_konta(
+            data_startu='2023-04', ile_wplat=5 * 12, wysokosc_wplat=800,
+            zalozenia=zalozenia_inflacji_i_wzrostu_m2(
+                data_startu='2023', inflacja=inflacja, wzrost_m2=wzrost_m2),
+            lokata=Bank(name="Alior", oprocentowanie_lokaty=oprocentowanie))
+
+        pd.testing.assert_frame_equal(sesja.konto(), df_konto)
+        pd.testing.assert_frame_equal(sesja.zestawienie_roczne(), df_roczne)
+        self.assertAlmostEqual(sesja.wartosc_koncowa(),
+                               df_konto[KOL_TOTAL_TOTAL].iloc[-1])
+
+    def test_procent_wplaty_zgodny_z_odsetkami_bankowymi(self):
+        for start in ['2023-04-01', '2023-10-01', '2024-01-01']:
+            daty = pd.date_range(
+                start=start,
+                periods=24,
+                freq=pd.offsets.MonthBegin()
+            )
+            for bank in [PEKAO, ALIOR]:
+                oczekiwane = list(bank.oprocentowanie_lokaty(daty)['Odsetki'])
+                testowane = [
+                    bank.oprocentowanie_wplaty(daty[0], nr, data)
+                    for nr, data in enumerate(daty, start=1)]
+                self.assertEqual(testowane, oczekiwane)
+
+    def test_symulacja_konta_porcjami_zgodna_z_symulacja_konta(self):
+        zalozenia = zalozenia_inflacji_i_wzrostu_m2(
+            data_startu='2023', inflacja=[pct / 100 for pct in [9.6] * 6],
+            wzrost_m2=None)
+        bank_bez_regul_wplat = Bank(
+            name="Alior", oprocentowanie_lokaty=odsetki_bankowe_alior)
+
+        for lokata in [PEKAO, bank_bez_regul_wplat, None]:
+            _, _, df_konto, _ = symulacja_konta(
+                data_startu='2023-05', ile_wplat=50, wysokosc_wplat=1000,
+                zalozenia=zalozenia, lokata=lokata)
+            testowane = pd.concat(symulacja_konta_porcjami(
+                data_startu='2023-05', wysokosc_wplat=1000,
+                zalozenia=zalozenia, lokata=lokata, ile_wplat=50,
+                rozmiar_porcji=7))
+            pd.testing.assert_frame_equal(testowane, df_konto)
+
+    def test_symulacja_konta_miesiacami_do_konca_zalozen(self):
+        zalozenia = zalozenia_inflacji_i_wzrostu_m2(
+            data_startu='2023', inflacja=[pct / 100 for pct in [9.6] * 3],
+            wzrost_m2=None)
+
+        stany = list(symulacja_konta_miesiacami(
+            data_startu='2023-05', wysokosc_wplat=1000, zalozenia=zalozenia,
+            lokata=PEKAO))
+
+        # od 2023-05 do końca 2025
+        self.assertEqual(len(stany), 8 + 24)
+        self.assertEqual(stany[-1].wplata_nr, 32)
+        self.assertEqual(stany[-1].miesiac, pd.Timestamp(2025, 12, 1))
+        self.assertEqual(stany[-1].suma_wplat, 32_000)
+
+    def test_symulacja_konta_szybki_silnik_zgodny_z_referencyjnym(self):
+        self.assertIsNone(porownaj_silniki(ile_scenariuszy=30, ziarno=0))
+
+    def test_minimalizuj_scenariusz(self):
+        scenariusz = Scenariusz(
+            data_startu='2023-10-15', ile_wplat=100, wysokosc_wplat=700,
+            inflacja=(0.1234, 0.05, 0.0312, 0.2, 0.07, 0.02, 0.09, 0.11,
+                      0.04, 0.03),
+            wzrost_m2=(0.02, None, 0.04, 0.05, 0.06, 0.07, 0.08, 0.09, 0.1,
+                       0.11),
+            bank='Pekao')
+
+        testowany = minimalizuj_scenariusz(
+            scenariusz, lambda s: s.ile_wplat >= 20)
+
+        self.assertEqual(testowany, Scenariusz(
+            data_startu='2023-11-01', ile_wplat=20, wysokosc_wplat=1000,
+            inflacja=(0.12, 0.12, 0.12), wzrost_m2=None, bank='Pekao'))
+
+    def test_symulacja_konta_wsadowa(self):
+        zalozenia = zalozenia_inflacji_i_wzrostu_m2(
+            data_startu='2023', inflacja=[0.12, 0.06, 0.05, 0.04],
+            wzrost_m2=None)
+
+        testowane = symulacja_konta_wsadowa(
+            data_startu='2023-03', ile_wplat=36, wysokosci_wplat=[300, 1000],
+            zalozenia=zalozenia, lokata=PEKAO)
+
+        for wysokosc_wplat in [300, 1000]:
+            _, _, _, df_roczne = symulacja_konta(
+                data_startu='2023-03', ile_wplat=36,
+                wysokosc_wplat=wysokosc_wplat, zalozenia=zalozenia,
+                lokata=PEKAO)
+            oczekiwane = df_roczne.iloc[-1]
+            oczekiwane.index = oczekiwane.index.get_level_values(1)
+            pd.testing.assert_series_equal(
+                testowane.loc[wysokosc_wplat], oczekiwane, check_names=False)
+
+    def test_sesja_symulacji_okno_zestawienia_miesiecznego(self):
+        sesja = SesjaSymulacji(
+            data_startu='2024-01', ile_wplat=36, wysokosc_wplat=1000,
+            zalozenia=zalozenia_inflacji_i_wzrostu_m2(
+                data_startu='2024', inflacja=[pct / 100 for pct in [9.6] * 3],
+                wzrost_m2=None),
+            lokata=PEKAO)
+
+        pd.testing.assert_frame_equal(sesja.konto(od=12, ile=10),
+                                      sesja.konto().iloc[12:22])
+        pd.testing.assert_frame_equal(sesja.konto(od=30, ile=10),
+                                      sesja.konto().iloc[30:])
+
     # def test_notebooka(self):
     #     wyswietl_symulacje(
     #         data_startu='2024-01',